@@ -0,0 +1,18 @@
+import os
+import json
+
+ASSET_DIR = "assets"
+MANIFEST = "manifest.json"
+
+_manifest = None
+
+def asset_path(name):
+    """Path to an asset, resolved through the web build's content-hashed manifest if present"""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(ASSET_DIR, MANIFEST)) as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}  # Running from the source tree
+    return os.path.join(ASSET_DIR, _manifest.get(name, name))
@@ -1,49 +1,253 @@
 import pygame
 import math
-from .settings import WIDTH
+from .settings import WIDTH, HEIGHT, BULLET_TRAJECTORIES, BULLET_ADDITIVE_GLOW
+from .entities import (World, TRANSFORM, VELOCITY, SPAWN, COLLIDER, RENDERABLE, HANDLE, move, outside, lround)
+
+# Glow sprites shared by every bullet with the same color, radius, render scale and blend mode
+_glow_cache = {}
+MAX_GLOW_SPRITES = 256
+
+def _render_glow(color, radius):
+    # Create a larger surface to accommodate the glow
+    glow_radius = max(1, round(radius * 2))
+    image = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
+
+    # Draw the outer glow
+    glow_color = (*color[:3], 40)
+    pygame.draw.circle(image, glow_color, (glow_radius, glow_radius), glow_radius)
+
+    # Draw a medium glow
+    medium_radius = int(radius * 1.5)
+    medium_color = (*color[:3], 90)
+    pygame.draw.circle(image, medium_color, (glow_radius, glow_radius), medium_radius)
+
+    # Draw the main bullet
+    pygame.draw.circle(image, color, (glow_radius, glow_radius), radius)
+    return image
+
+def glow_sprite(color, radius, scale=1.0, additive=False):
+    key = (tuple(color), radius, scale, additive)
+    image = _glow_cache.get(key)
+    if image is None:
+        # Pulsing corner particles cycle through many colors, so keep the cache bounded
+        if len(_glow_cache) >= MAX_GLOW_SPRITES:
+            _glow_cache.clear()
+        image = _render_glow(color, radius * scale)
+        if additive:
+            # Pre-multiply the glow over black so it can be added with BLEND_RGB_ADD
+            flat = pygame.Surface(image.get_size())
+            flat.blit(image, (0, 0))
+            image = flat
+        _glow_cache[key] = image
+    return image
+
+def draw_bullets(camera, field, additive=BULLET_ADDITIVE_GLOW):
+    """Render system: one blits call per shared glow sprite"""
+    batches = {}
+    xs, ys = field.positions()
+    columns = field.archetype.columns
+    for x, y, color, size in zip(xs, ys, columns['color'], columns['size']):
+        key = (color, size)
+        batch = batches.get(key)
+        if batch is None:
+            batch = batches[key] = []
+        batch.append((x, y))
+    blit_batches(camera, batches, additive)
+
+def blit_batches(camera, batches, additive=BULLET_ADDITIVE_GLOW):
+    """Blit {(color, radius): [(x, y), ...]} world positions, one call per glow sprite"""
+    surface = camera.surface
+    s = camera.scale
+    ox, oy = camera.offset
+    flags = pygame.BLEND_RGB_ADD if additive else 0
+    fblits = getattr(surface, 'fblits', None)  # pygame-ce only
+    for (color, radius), positions in batches.items():
+        image = glow_sprite(color, radius, s, additive)
+        half = image.get_width() // 2
+        if fblits is not None:
+            fblits([(image, (int((x + ox) * s) - half, int((y + oy) * s) - half))
+                    for x, y in positions], flags)
+        else:
+            surface.blits([(image, (int((x + ox) * s) - half, int((y + oy) * s) - half), None, flags)
+                           for x, y in positions], doreturn=False)
+
+def exit_ticks(x, y, vx, vy):
+    """Ticks after launch until a bullet at (x, y) is past the despawn bounds"""
+    ticks = math.inf
+    for start, speed, high in ((x, vx, WIDTH + 10), (y, vy, HEIGHT + 10)):
+        if not -10 <= start + speed <= high:
+            return 1
+        # Motion is linear, so once inside the bullet leaves through the bound it moves towards
+        if speed > 0:
+            ticks = min(ticks, math.floor((high - start) / speed) + 1)
+        elif speed < 0:
+            ticks = min(ticks, math.floor((-10 - start) / speed) + 1)
+    if ticks == math.inf:
+        return None  # Stationary bullets never leave
+    return ticks
+
+class Bullet:
+    """A glowing round projectile.
+
+    While in a BulletField the bullet's state lives in the field's component
+    columns and this object is only a handle to its entity. Bullets that have
+    not been added yet, or were removed, keep their last state here.
+    """
+    __slots__ = ('field', 'entity', '_x', '_y', '_vx', '_vy', '_color', '_radius')
 
-class Bullet(pygame.sprite.Sprite):
     def __init__(self, pos, velocity, color, radius=5):
-        super().__init__()
-        self.pos = pygame.math.Vector2(pos)
-        self.velocity = pygame.math.Vector2(velocity)
-        self._radius = radius  # Use private variable for radius
-        self.color = color
-        self._update_image()  # Create initial image
-        self.rect = self.image.get_rect(center=self.pos)
+        self.field = None  # BulletField the bullet lives in
+        self.entity = None
+        self._x, self._y = pos
+        self._vx, self._vy = velocity
+        self._color = color
+        self._radius = radius
+
+    @property
+    def pos(self):
+        field = self.field
+        if field is None:
+            return pygame.math.Vector2(self._x, self._y)
+        row = field.archetype.rows[self.entity]
+        xs, ys = field.positions()
+        return pygame.math.Vector2(xs[row], ys[row])
+
+    @property
+    def color(self):
+        if self.field is None:
+            return self._color
+        return self.field.archetype.get(self.entity, 'color')
+
+    @color.setter
+    def color(self, value):
+        if self.field is None:
+            self._color = value
+        else:
+            self.field.archetype.set(self.entity, 'color', value)
 
     @property
     def radius(self):
-        return self._radius
-    
+        if self.field is None:
+            return self._radius
+        return self.field.archetype.get(self.entity, 'radius')
+
     @radius.setter
     def radius(self, value):
-        self._radius = value
-        self._update_image()  # Update image when radius changes
-        
-    def _update_image(self):
-        # Create a larger surface to accommodate the glow
-        glow_radius = self._radius * 2
-        self.image = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-        
-        # Draw the outer glow
-        glow_color = (*self.color[:3], 40)
-        pygame.draw.circle(self.image, glow_color, (glow_radius, glow_radius), glow_radius)
-        
-        # Draw a medium glow
-        medium_radius = int(self._radius * 1.5)
-        medium_color = (*self.color[:3], 90)
-        pygame.draw.circle(self.image, medium_color, (glow_radius, glow_radius), medium_radius)
-        
-        # Draw the main bullet
-        pygame.draw.circle(self.image, self.color, (glow_radius, glow_radius), self._radius)
-        
-        # Update rect size
-        self.rect = self.image.get_rect(center=self.pos)
+        if self.field is None:
+            self._radius = value
+        else:
+            # Collider and sprite size track each other
+            self.field.archetype.set(self.entity, 'radius', value)
+            self.field.archetype.set(self.entity, 'size', value)
+
+    @property
+    def rect(self):
+        # Same box as the glow sprite centered on the bullet
+        half = max(1, round(self.radius * 2))
+        pos = self.pos
+        return pygame.Rect(lround(pos.x) - half, lround(pos.y) - half, half * 2, half * 2)
+
+    def kill(self):
+        if self.field is not None:
+            self.field.remove(self)
+
+BULLET = (TRANSFORM, VELOCITY, SPAWN, COLLIDER, RENDERABLE, HANDLE)
+
+class BulletField:
+    """Bullets stored as entities in one archetype, moved a column at a time.
+
+    Positions are analytic: x, y hold where each bullet spawned and its position
+    at any tick is x + vx * (tick - spawn), computed for the whole field at most
+    once per tick. Exit ticks are queued at spawn so despawning costs nothing
+    per tick. With trajectory=False bullets are stepped and bounds-checked
+    every tick by the movement system instead.
+    """
+    def __init__(self, trajectory=BULLET_TRAJECTORIES, world=None, name="bullets"):
+        self.trajectory = trajectory
+        self.world = world if world is not None else World()
+        self.archetype = self.world.archetype(name, *BULLET)
+        self.tick = 0
+        self._exits = {}  # exit tick -> entities leaving the screen on that tick
+        self._positions = None  # Position columns for the current tick
+
+    def __len__(self):
+        return len(self.archetype)
+
+    def __iter__(self):
+        # Iterate over a snapshot so bullets can be killed while looping
+        return iter(list(self.archetype.columns['handle']))
+
+    def positions(self):
+        """Current x and y columns, row-aligned with the archetype"""
+        columns = self.archetype.columns
+        if not self.trajectory:
+            return columns['x'], columns['y']
+        if self._positions is None:
+            tick = self.tick
+            ages = [tick - spawn for spawn in columns['spawn']]
+            self._positions = (
+                [x + vx * age for x, vx, age in zip(columns['x'], columns['vx'], ages)],
+                [y + vy * age for y, vy, age in zip(columns['y'], columns['vy'], ages)],
+            )
+        return self._positions
+
+    def add(self, bullet):
+        if bullet.field is not None:
+            bullet.field.remove(bullet)
+        x, y, vx, vy = bullet._x, bullet._y, bullet._vx, bullet._vy
+        bullet.entity = self.world.spawn(self.archetype, {
+            'x': x, 'y': y, 'vx': vx, 'vy': vy, 'spawn': self.tick,
+            'radius': bullet._radius, 'color': bullet._color, 'size': bullet._radius, 'handle': bullet,
+        })
+        bullet.field = self
+        bullet._x = bullet._y = bullet._vx = bullet._vy = None  # State lives in the columns now
+        if self._positions is not None:
+            self._positions[0].append(x)
+            self._positions[1].append(y)
+        if self.trajectory:
+            ticks = exit_ticks(x, y, vx, vy)
+            if ticks is not None:
+                self._exits.setdefault(self.tick + ticks, []).append(bullet.entity)
+
+    def remove(self, bullet):
+        if bullet.field is not self:
+            return
+        # Hand the bullet's current state back so it stays where it was removed
+        archetype = self.archetype
+        columns = archetype.columns
+        row = archetype.rows[bullet.entity]
+        xs, ys = self.positions()
+        bullet._x, bullet._y = xs[row], ys[row]
+        bullet._vx, bullet._vy = columns['vx'][row], columns['vy'][row]
+        bullet._color = columns['color'][row]
+        bullet._radius = columns['radius'][row]
+        archetype.remove(bullet.entity)
+        if self._positions is not None:
+            # Mirror the archetype's swap-remove so cached positions stay row-aligned
+            for column in self._positions:
+                column[row] = column[-1]
+                column.pop()
+        bullet.field = None
+        bullet.entity = None
+
+    def empty(self):
+        for bullet in reversed(self.archetype.columns['handle']):
+            self.remove(bullet)
+        self._exits.clear()
 
     def update(self):
-        self.pos += self.velocity
-        self.rect.center = self.pos
-        if (self.pos.x < -10 or self.pos.x > WIDTH+10 or
-            self.pos.y < -10 or self.pos.y > WIDTH+10):
-            self.kill()
+        archetype = self.archetype
+        if not self.trajectory:
+            move(archetype)
+            columns = archetype.columns
+            gone = outside(archetype, columns['x'], columns['y'], -10, -10, WIDTH + 10, HEIGHT + 10)
+            for entity in gone:
+                self.remove(archetype.get(entity, 'handle'))
+            return
+        self.tick += 1
+        self._positions = None
+        expired = self._exits.pop(self.tick, None)
+        if expired:
+            for entity in expired:
+                if entity in archetype:
+                    self.remove(archetype.get(entity, 'handle'))
@@ -0,0 +1,95 @@
+import pygame
+from .settings import WIDTH, HEIGHT, RENDER_SCALE
+from .utils import ScreenShake
+
+class Camera:
+    """Owns the view onto the world and draws world-space shapes and sprites through it.
+
+    Every draw call applies the view offset (pan plus screen shake) and the render
+    scale. At RENDER_SCALE 1 the world is drawn straight onto the display surface;
+    below 1 it is drawn onto a smaller internal surface that present() upscales.
+    """
+    def __init__(self, screen, scale=RENDER_SCALE):
+        self.screen = screen
+        self.scale = scale
+        self.width = max(1, int(WIDTH * scale))
+        self.height = max(1, int(HEIGHT * scale))
+        if scale == 1:
+            self.surface = screen
+        else:
+            self.surface = pygame.Surface((self.width, self.height))
+        self.pan = pygame.math.Vector2(0, 0)
+        self.shake = ScreenShake()
+        self.offset = (0, 0)
+
+    def update(self, dt):
+        shake = self.shake.update(dt)
+        self.offset = (self.pan.x + shake.x, self.pan.y + shake.y)
+
+    def point(self, pos):
+        s = self.scale
+        return (int((pos[0] + self.offset[0]) * s), int((pos[1] + self.offset[1]) * s))
+
+    def _width(self, width):
+        # 0 means filled for pygame.draw, keep it that way
+        return max(1, round(width * self.scale)) if width else 0
+
+    def fit_background(self, image):
+        return pygame.transform.scale(image, (self.width, self.height))
+
+    def draw_background(self, image):
+        """Blit a fitted background at the view offset, clearing only the strips it uncovers"""
+        x, y = self.point((0, 0))
+        surface = self.surface
+        surface.blit(image, (x, y))
+        if x > 0:
+            surface.fill((0, 0, 0), (0, 0, x, self.height))
+        elif x < 0:
+            surface.fill((0, 0, 0), (self.width + x, 0, -x, self.height))
+        if y > 0:
+            surface.fill((0, 0, 0), (0, 0, self.width, y))
+        elif y < 0:
+            surface.fill((0, 0, 0), (0, self.height + y, self.width, -y))
+
+    def blit(self, image, pos):
+        """Blit a world-space image with its top-left corner at pos"""
+        s = self.scale
+        if s != 1:
+            w, h = image.get_size()
+            image = pygame.transform.scale(image, (max(1, round(w * s)), max(1, round(h * s))))
+        self.surface.blit(image, self.point(pos))
+
+    def circle(self, color, center, radius, width=0):
+        pygame.draw.circle(self.surface, color, self.point(center),
+                           max(1, radius * self.scale), self._width(width))
+
+    def arc(self, color, center, radius, start_angle, stop_angle, width=1):
+        x, y = self.point(center)
+        r = radius * self.scale
+        pygame.draw.arc(self.surface, color, (x - r, y - r, r * 2, r * 2),
+                        start_angle, stop_angle, self._width(width))
+
+    def alpha_circle(self, color, center, radius, width=0):
+        """Circle with per-pixel alpha, drawn through a surface sized to the circle"""
+        r = max(1, int(radius * self.scale))
+        circle_surface = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(circle_surface, color, (r, r), r, self._width(width))
+        x, y = self.point(center)
+        self.surface.blit(circle_surface, (x - r, y - r))
+
+    def alpha_line(self, color, start, end, width=1):
+        """Line with per-pixel alpha, drawn through a surface covering only its bounding box"""
+        w = self._width(width)
+        x1, y1 = self.point(start)
+        x2, y2 = self.point(end)
+        left = min(x1, x2) - w
+        top = min(y1, y2) - w
+        line_surface = pygame.Surface((abs(x2 - x1) + w * 2 + 1, abs(y2 - y1) + w * 2 + 1),
+                                      pygame.SRCALPHA)
+        pygame.draw.line(line_surface, color, (x1 - left, y1 - top), (x2 - left, y2 - top), w)
+        self.surface.blit(line_surface, (left, top))
+
+    def present(self):
+        """Upscale the internal surface onto the screen; a no-op when drawing directly"""
+        if self.surface is not self.screen:
+            pygame.transform.scale(self.surface, (WIDTH, HEIGHT), self.screen)
@@ -0,0 +1,35 @@
+import pygame
+
+class Controls:
+    """Player input sampled for one simulation step"""
+    __slots__ = ('move_x', 'move_y', 'fire', 'aim_x', 'aim_y', 'roll')
+
+    def __init__(self):
+        self.move_x = 0  # -1, 0 or 1
+        self.move_y = 0
+        self.fire = False
+        self.aim_x = 0
+        self.aim_y = 0
+        self.roll = False  # Roll was pressed since the last step
+
+def poll_controls(controls):
+    """Sample movement, fire button and aim from pygame's current input state"""
+    keys = pygame.key.get_pressed()
+    controls.move_x = 0
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        controls.move_x = -1
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        controls.move_x = 1
+    controls.move_y = 0
+    if keys[pygame.K_UP] or keys[pygame.K_w]:
+        controls.move_y = -1
+    if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        controls.move_y = 1
+    controls.fire = bool(pygame.mouse.get_pressed()[0])
+    controls.aim_x, controls.aim_y = pygame.mouse.get_pos()
+    return controls
+
+def latch_controls(controls):
+    """Sample again just before a simulation step, pumping the queue so held keys and aim are current"""
+    pygame.event.pump()
+    return poll_controls(controls)
@@ -0,0 +1,157 @@
+from array import array
+from operator import add
+
+# Components map field names to an array typecode, or None for a column of Python objects
+TRANSFORM = {'x': 'd', 'y': 'd'}
+VELOCITY = {'vx': 'd', 'vy': 'd'}  # Per tick
+SPAWN = {'spawn': 'q'}  # Tick the entity was spawned on
+COLLIDER = {'radius': 'd'}
+RENDERABLE = {'color': None, 'size': 'd'}
+LIFETIME = {'lifetime': 'd'}  # Seconds left
+HANDLE = {'handle': None}  # Object standing in for the entity outside the store
+HITBOX = {'left': 'd', 'top': 'd', 'right': 'd', 'bottom': 'd'}  # Box colliders hit, kept in step with its handle
+
+class Archetype:
+    """Entities sharing one set of components, stored as one packed column per field.
+
+    Rows stay dense: removing an entity moves the last row into its place, so
+    systems can run straight down the columns.
+    """
+    def __init__(self, name, *components):
+        self.name = name
+        self.types = {}
+        for component in components:
+            self.types.update(component)
+        self.columns = {field: array(typecode) if typecode else []
+                        for field, typecode in self.types.items()}
+        self.entities = []  # Row -> entity
+        self.rows = {}  # Entity -> row
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity):
+        return entity in self.rows
+
+    def add(self, entity, values):
+        self.rows[entity] = len(self.entities)
+        self.entities.append(entity)
+        for field, column in self.columns.items():
+            column.append(values[field])
+
+    def remove(self, entity):
+        row = self.rows.pop(entity)
+        last = len(self.entities) - 1
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved] = row
+            for column in self.columns.values():
+                column[row] = column[last]
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+
+    def clear(self):
+        for column in self.columns.values():
+            del column[:]
+        self.entities.clear()
+        self.rows.clear()
+
+    def get(self, entity, field):
+        return self.columns[field][self.rows[entity]]
+
+    def set(self, entity, field, value):
+        self.columns[field][self.rows[entity]] = value
+
+class World:
+    """Hands out entity ids and owns the archetypes they live in"""
+    def __init__(self):
+        self.archetypes = {}
+        self._next_entity = 0
+
+    def archetype(self, name, *components):
+        archetype = self.archetypes[name] = Archetype(name, *components)
+        return archetype
+
+    def spawn(self, archetype, values):
+        entity = self._next_entity
+        self._next_entity += 1
+        archetype.add(entity, values)
+        return entity
+
+    def clear(self):
+        for archetype in self.archetypes.values():
+            archetype.clear()
+
+# Systems: each runs over whole columns of one archetype
+
+def move(archetype):
+    """Advance every transform by its velocity, one tick"""
+    columns = archetype.columns
+    xs, ys = columns['x'], columns['y']
+    xs[:] = array('d', map(add, xs, columns['vx']))
+    ys[:] = array('d', map(add, ys, columns['vy']))
+
+def expire(archetype, dt):
+    """Count lifetimes down by dt and remove entities whose time is up"""
+    lifetimes = archetype.columns['lifetime']
+    lifetimes[:] = array('d', [t - dt for t in lifetimes])
+    dead = [entity for entity, t in zip(archetype.entities, lifetimes) if t <= 0]
+    for entity in dead:
+        archetype.remove(entity)
+    return dead
+
+def outside(archetype, xs, ys, left, top, right, bottom):
+    """Entities whose position is outside the given bounds"""
+    return [entity for entity, x, y in zip(archetype.entities, xs, ys)
+            if x < left or x > right or y < top or y > bottom]
+
+def lround(value):
+    """Rounding pygame uses for float rect coordinates, half away from zero"""
+    return int(value + 0.5) if value >= 0 else int(value - 0.5)
+
+def overlapping(archetype, xs, ys, left, top, right, bottom):
+    """Entities whose collider box overlaps the given bounds.
+
+    A collider's box reaches twice its radius either way from its position,
+    rounded to whole pixels as a pygame.Rect would be.
+    """
+    radii = archetype.columns['radius']
+    if not radii:
+        return []
+    # Coarse reject with the widest box, then the exact box test on what's left
+    reach = max(radii) * 2 + 2
+    near_left, near_right = left - reach, right + reach
+    near_top, near_bottom = top - reach, bottom + reach
+    entities = archetype.entities
+    hits = []
+    for row, (x, y) in enumerate(zip(xs, ys)):
+        if near_left < x < near_right and near_top < y < near_bottom:
+            half = max(1, round(radii[row] * 2))
+            bx = lround(x) - half
+            by = lround(y) - half
+            if bx < right and left < bx + half * 2 and by < bottom and top < by + half * 2:
+                hits.append(entities[row])
+    return hits
+
+def sync_hitboxes(hitboxes, rect_of):
+    """Copy rect_of(handle), a pygame.Rect, into every hitbox's columns"""
+    columns = hitboxes.columns
+    lefts, tops, rights, bottoms = columns['left'], columns['top'], columns['right'], columns['bottom']
+    for row, handle in enumerate(columns['handle']):
+        rect = rect_of(handle)
+        lefts[row], tops[row], rights[row], bottoms[row] = rect.left, rect.top, rect.right, rect.bottom
+
+def collide(colliders, xs, ys, hitboxes):
+    """(hitbox handle, handles of the colliders overlapping it) for every hitbox something overlaps"""
+    columns = hitboxes.columns
+    handles = colliders.columns['handle']
+    rows = colliders.rows
+    hits = []
+    for target, left, top, right, bottom in zip(columns['handle'], columns['left'], columns['top'],
+                                                columns['right'], columns['bottom']):
+        entities = overlapping(colliders, xs, ys, left, top, right, bottom)
+        if entities:
+            hits.append((target, [handles[rows[entity]] for entity in entities]))
+    return hits
@@ -0,0 +1,146 @@
+import random
+
+# Event kinds pushed by simulation code
+HIT = 0            # target, source, pos, remaining hearts/health
+ATTACK_CHOSEN = 1  # attack name, attacks left in pool, pool was reset
+PHASE_CHANGE = 2   # phase name
+SOUND = 3          # sound name, loops
+SOUND_FADEOUT = 4  # sound name, fade time in ms
+NUM_KINDS = 5
+
+# Log levels
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "off": 100}
+
+PHASE_MESSAGES = {
+    "fight": "Boss intro complete - fight begins!",
+    "gauntlet": "Boss teleports to center and enters intermission gauntlet! Immune for 10 seconds.",
+    "phase2": "Phase 2 begins!",
+    "defeated": "Boss defeated!",
+    "game_over": "Game Over!",
+}
+
+class EventBus:
+    """Fixed-capacity event queue that is filled during a frame and drained once at its end"""
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        # Parallel preallocated slots so emitting never allocates
+        self.kinds = [0] * capacity
+        self.arg_a = [None] * capacity
+        self.arg_b = [None] * capacity
+        self.arg_c = [None] * capacity
+        self.arg_d = [None] * capacity
+        self.count = 0
+        self.dropped = 0
+        self.handlers = [[] for _ in range(NUM_KINDS)]
+
+    def subscribe(self, kind, handler):
+        self.handlers[kind].append(handler)
+
+    def emit(self, kind, a=None, b=None, c=None, d=None):
+        n = self.count
+        if n >= self.capacity:
+            self.dropped += 1
+            return
+        self.kinds[n] = kind
+        self.arg_a[n] = a
+        self.arg_b[n] = b
+        self.arg_c[n] = c
+        self.arg_d[n] = d
+        self.count = n + 1
+
+    def drain(self):
+        n = self.count
+        if not n:
+            return
+        handlers = self.handlers
+        kinds, arg_a, arg_b, arg_c, arg_d = self.kinds, self.arg_a, self.arg_b, self.arg_c, self.arg_d
+        for i in range(n):
+            for handler in handlers[kinds[i]]:
+                handler(arg_a[i], arg_b[i], arg_c[i], arg_d[i])
+            # Drop references so drained payloads can be freed
+            arg_a[i] = arg_b[i] = arg_c[i] = arg_d[i] = None
+        self.count = 0
+        if self.dropped:
+            print(f"Event bus full: dropped {self.dropped} events this frame (capacity {self.capacity})")
+            self.dropped = 0
+
+    def clear(self):
+        for i in range(self.count):
+            self.arg_a[i] = self.arg_b[i] = self.arg_c[i] = self.arg_d[i] = None
+        self.count = 0
+        self.dropped = 0
+
+class EventLogger:
+    """Prints events at or above a level; "off" subscribes to nothing"""
+    def __init__(self, events, level="off"):
+        self.level = LEVELS[level]
+        if self.level >= LEVELS["off"]:
+            return
+        events.subscribe(HIT, self.on_hit)
+        events.subscribe(ATTACK_CHOSEN, self.on_attack_chosen)
+        events.subscribe(PHASE_CHANGE, self.on_phase_change)
+        events.subscribe(SOUND, self.on_sound)
+
+    def log(self, level, message):
+        if LEVELS[level] >= self.level:
+            print(message)
+
+    def on_hit(self, target, source, pos, remaining):
+        if target == "player":
+            if source == "melee":
+                self.log("info", f"Player hit by melee! Hearts left: {remaining}")
+            else:
+                self.log("info", f"Player hit! Hearts left: {remaining}")
+        else:
+            self.log("debug", f"Boss hit! Health left: {remaining}")
+
+    def on_attack_chosen(self, attack, remaining, pool_reset, _):
+        if pool_reset:
+            self.log("debug", "Resetting attack pool!")
+        if attack == "melee":
+            self.log("info", "Boss melee swing!")
+        else:
+            self.log("info", f"Chose attack: {attack}. Remaining attacks: {remaining}")
+
+    def on_phase_change(self, phase, *_):
+        self.log("info", PHASE_MESSAGES.get(phase, phase))
+
+    def on_sound(self, name, loops, *_):
+        self.log("debug", f"Sound cue: {name}")
+
+class AudioPlayer:
+    """Plays sound cues from a name -> Sound dict, which stays empty until sounds are loaded"""
+    def __init__(self, events):
+        self.sounds = {}
+        events.subscribe(SOUND, self.on_sound)
+        events.subscribe(SOUND_FADEOUT, self.on_fadeout)
+
+    def on_sound(self, name, loops, *_):
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        try:
+            sound.play(loops or 0)
+        except Exception as e:
+            # Report once, then stop cueing the broken sound
+            print(f"Error playing sound {name}: {e}")
+            self.sounds[name] = None
+
+    def on_fadeout(self, name, ms, *_):
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.fadeout(ms)
+
+class HitEffects:
+    """Screen shake on player hits and impact sparks on boss hits"""
+    def __init__(self, events, screen_shake, impacts):
+        self.screen_shake = screen_shake
+        self.impacts = impacts
+        events.subscribe(HIT, self.on_hit)
+
+    def on_hit(self, target, source, pos, remaining):
+        if target == "player":
+            if source == "bullet":
+                self.screen_shake.start_shake(0.2, 10.0)
+        elif random.random() < 0.3:
+            self.impacts.spawn(pos)
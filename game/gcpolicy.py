@@ -0,0 +1,64 @@
+import gc
+import time
+
+YOUNG_LIMIT = 5000  # Allocations to let pile up in combat before a young collection
+YOUNG_BUDGET = 0.004  # Seconds the frame gap must have left for one
+
+class GCPolicy:
+    """Keeps cyclic garbage collection out of combat frames.
+
+    Everything loaded up front is frozen out of collection for good. While
+    fighting, automatic collection is off and the game calls idle() in the gap
+    after each frame is presented. A full collection runs there once per safe
+    window (the boss intro, its intermission delay, any screen but the fight),
+    and a young one whenever combat garbage piles up past YOUNG_LIMIT and the
+    gap has time for it. Time spent in every collection, automatic or not,
+    adds up until take_pause().
+    """
+    def __init__(self, young_limit=YOUNG_LIMIT):
+        self.young_limit = young_limit
+        self.in_combat = False
+        self.needs_full = False  # Combat garbage waiting for a safe window
+        self.pause = 0.0  # Seconds spent collecting since take_pause()
+        self._began = 0.0
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._began = time.perf_counter()
+        else:
+            self.pause += time.perf_counter() - self._began
+
+    def loaded(self):
+        """Collect, then move everything alive now (assets, caches, the arena) out of collection"""
+        gc.collect()
+        gc.freeze()
+
+    def combat(self, fighting):
+        """Turn automatic collection off while fighting and back on otherwise"""
+        if fighting and not self.in_combat:
+            gc.disable()
+            self.needs_full = True
+        elif not fighting and self.in_combat:
+            gc.enable()
+        self.in_combat = fighting
+
+    def idle(self, safe, time_left):
+        """Collect in the gap between frames: in full when safe, young generation when it has grown"""
+        if safe:
+            if self.needs_full:
+                gc.collect()
+                self.needs_full = False
+        elif self.in_combat:
+            self.needs_full = True
+            if gc.get_count()[0] > self.young_limit and time_left > YOUNG_BUDGET:
+                gc.collect(0)
+
+    def take_pause(self):
+        """Seconds spent collecting since the last call"""
+        pause, self.pause = self.pause, 0.0
+        return pause
+
+    def close(self):
+        gc.callbacks.remove(self._on_gc)
+        gc.enable()
@@ -0,0 +1,47 @@
+import pygame
+from .settings import COLLISION_RECT, PURPLE, BULLET_ADDITIVE_GLOW
+from .bullet import blit_batches
+
+CORNER_MARGIN = 50
+CORNER_RADIUS = 15
+PULSE_LEVELS = 32  # Flash colors between purple and white; each gets one cached glow sprite
+
+# Purple to white, indexed by flash level
+PULSE_COLORS = [tuple(int(c + (255 - c) * level / PULSE_LEVELS) for c in PURPLE)
+                for level in range(PULSE_LEVELS + 1)]
+
+class StaticHazards:
+    """The four corner hazards, kept out of the moving bullet field.
+
+    They never move, expire or get destroyed, so nothing steps, culls or
+    scans them with the bullets. Hit boxes are the glow box a bullet of the
+    same radius would have, built once per radius the pulse reaches, and the
+    player is tested against all four in one collidelist call. The pulse
+    color is quantized to PULSE_LEVELS so its glow sprites stay cached.
+    """
+    def __init__(self):
+        left, top = COLLISION_RECT.left + CORNER_MARGIN, COLLISION_RECT.top + CORNER_MARGIN
+        right, bottom = COLLISION_RECT.right - CORNER_MARGIN, COLLISION_RECT.bottom - CORNER_MARGIN
+        self.positions = [(left, top), (right, top), (left, bottom), (right, bottom)]
+        self.radius = CORNER_RADIUS
+        self.color = PURPLE
+        self._rects = {}  # radius -> hit boxes
+
+    def pulse(self, flash):
+        """Grow and whiten by flash, from 0 (at rest) to 1 (twice the size, white)"""
+        self.radius = int(CORNER_RADIUS * (1 + flash))
+        self.color = PULSE_COLORS[round(flash * PULSE_LEVELS)]
+
+    def rects(self):
+        rects = self._rects.get(self.radius)
+        if rects is None:
+            half = max(1, round(self.radius * 2))
+            rects = self._rects[self.radius] = [pygame.Rect(x - half, y - half, half * 2, half * 2)
+                                                for x, y in self.positions]
+        return rects
+
+    def collide(self, rect):
+        return rect.collidelist(self.rects()) != -1
+
+    def draw(self, camera, additive=BULLET_ADDITIVE_GLOW):
+        blit_batches(camera, {(self.color, self.radius): self.positions}, additive)
@@ -0,0 +1,100 @@
+import os
+try:
+    import numpy as np
+except ImportError:  # Not bundled with the browser build
+    np = None
+import pygame
+from .settings import COLLISION_RECT
+from .events import HIT
+
+CELL_SIZE = 8  # Pixels per histogram cell
+
+def available():
+    return np is not None
+
+class Heatmaps:
+    """Bullet occupancy and player hit locations, binned over COLLISION_RECT.
+
+    Histograms are kept per (attack, phase). Bullets outlive the attack that fired
+    them, so idle ticks count towards the last attack. Each sample bins the boss
+    bullet position columns with one bincount, a few array operations per tick
+    whatever the bullet count.
+    """
+    def __init__(self, events, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = -(-COLLISION_RECT.width // cell_size)
+        self.rows = -(-COLLISION_RECT.height // cell_size)
+        self.occupancy = {}  # (attack, phase) -> bullets per cell, summed over ticks
+        self.hits = {}  # (attack, phase) -> player hits per cell
+        self.ticks = {}  # (attack, phase) -> ticks sampled
+        self.key = ("intro", "phase1")
+        events.subscribe(HIT, self.on_hit)
+
+    def _grid(self, grids, key):
+        grid = grids.get(key)
+        if grid is None:
+            grid = grids[key] = np.zeros(self.rows * self.cols, np.int64)
+        return grid
+
+    def _cells(self, xs, ys):
+        """Flat cell index of every position inside COLLISION_RECT"""
+        cx = (np.asarray(xs, np.float64) - COLLISION_RECT.left) // self.cell_size
+        cy = (np.asarray(ys, np.float64) - COLLISION_RECT.top) // self.cell_size
+        inside = (cx >= 0) & (cx < self.cols) & (cy >= 0) & (cy < self.rows)
+        return (cy[inside] * self.cols + cx[inside]).astype(np.int64)
+
+    def sample(self, sim):
+        """Count one tick of boss bullets towards the current attack and phase"""
+        boss = sim.boss
+        attack = "gauntlet" if boss.in_gauntlet else boss.state
+        if attack == "idle":
+            attack = self.key[0]
+        self.key = key = (attack, "phase2" if boss.phase2 else "phase1")
+        self.ticks[key] = self.ticks.get(key, 0) + 1
+        xs, ys = sim.boss_bullets.positions()
+        if xs:
+            grid = self._grid(self.occupancy, key)
+            grid += np.bincount(self._cells(xs, ys), minlength=grid.size)
+
+    def on_hit(self, target, source, pos, remaining):
+        if target == "player":
+            cells = self._cells((pos[0],), (pos[1],))
+            if len(cells):
+                self._grid(self.hits, self.key)[cells[0]] += 1
+
+    def _image(self, values):
+        """Black-red-yellow-white ramp over values scaled to their maximum, at COLLISION_RECT size"""
+        values = values.reshape(self.rows, self.cols).astype(np.float64)
+        top = values.max()
+        t = values / top if top > 0 else values
+        rgb = np.dstack((t * 3, t * 3 - 1, t * 3 - 2)).clip(0, 1)
+        surface = pygame.surfarray.make_surface((rgb * 255).astype(np.uint8).transpose(1, 0, 2))
+        return pygame.transform.scale(surface, (self.cols * self.cell_size, self.rows * self.cell_size))
+
+    def export(self, directory):
+        """Write heatmaps.npz and one occupancy and hits PNG per attack and phase; returns the paths"""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {"cell_size": np.array(self.cell_size),
+                  "origin": np.array(COLLISION_RECT.topleft)}
+        paths = []
+        for key, ticks in sorted(self.ticks.items()):
+            name = "_".join(key)
+            occupancy = self.occupancy.get(key)
+            if occupancy is None:
+                occupancy = np.zeros(self.rows * self.cols, np.int64)
+            hits = self.hits.get(key)
+            if hits is None:
+                hits = np.zeros(self.rows * self.cols, np.int64)
+            arrays[f"ticks_{name}"] = np.array(ticks)
+            arrays[f"occupancy_{name}"] = occupancy.reshape(self.rows, self.cols)
+            arrays[f"hits_{name}"] = hits.reshape(self.rows, self.cols)
+            # Log scale so sparse lanes still show next to where bullets pile up
+            for kind, image in (("occupancy", self._image(np.log1p(occupancy / ticks))),
+                                ("hits", self._image(hits))):
+                path = os.path.join(directory, f"{kind}_{name}.png")
+                pygame.image.save(image, path)
+                paths.append(path)
+        path = os.path.join(directory, "heatmaps.npz")
+        np.savez_compressed(path, **arrays)
+        paths.append(path)
+        return paths
@@ -0,0 +1,68 @@
+import pygame
+from .settings import WIDTH, RED, GREEN, WHITE
+from .utils import draw_heart
+
+BAR_WIDTH = WIDTH * 0.7  # 70% of screen width
+BAR_HEIGHT = 20
+BAR_MARGIN_TOP = 20  # Distance from top of screen
+BORDER_WIDTH = 2
+HEART_SIZE = 30
+HEART_SPACING = 5
+HUD_HEIGHT = 80  # Tall enough for the bar, phase label and hearts
+
+class Hud:
+    """Boss health bar, phase label and hearts, cached as one surface.
+
+    The layer is only re-rendered when boss health, phase or hearts change.
+    """
+    def __init__(self, max_hearts=3, max_health=700):
+        self.max_hearts = max_hearts
+        self.max_health = max_health
+        self.layer = pygame.Surface((WIDTH, HUD_HEIGHT), pygame.SRCALPHA)
+        self._state = None
+
+        # Pre-rendered pieces
+        self.heart_full = self._render_heart(RED)
+        self.heart_empty = self._render_heart((100, 100, 100))
+        self.phase_label = pygame.font.Font(None, 36).render("PHASE 2", True, WHITE)
+        self.bar_left = (WIDTH - BAR_WIDTH) / 2
+        self.border_rect = pygame.Rect(
+            self.bar_left - BORDER_WIDTH,
+            BAR_MARGIN_TOP - BORDER_WIDTH,
+            BAR_WIDTH + BORDER_WIDTH * 2,
+            BAR_HEIGHT + BORDER_WIDTH * 2
+        )
+        self.bar_rect = pygame.Rect(self.bar_left, BAR_MARGIN_TOP, BAR_WIDTH, BAR_HEIGHT)
+
+    def _render_heart(self, color):
+        # A little taller than the heart so the bottom point isn't clipped
+        image = pygame.Surface((HEART_SIZE + 2, HEART_SIZE + 2), pygame.SRCALPHA)
+        draw_heart(image, HEART_SIZE // 2, HEART_SIZE // 2, HEART_SIZE, color)
+        return image
+
+    def _render(self, health, phase2, hearts):
+        layer = self.layer
+        layer.fill((0, 0, 0, 0))
+
+        # Border, empty bar and current health
+        pygame.draw.rect(layer, WHITE, self.border_rect)
+        pygame.draw.rect(layer, RED, self.bar_rect)
+        current_width = BAR_WIDTH * max(0, health) / self.max_health
+        pygame.draw.rect(layer, GREEN, (self.bar_left, BAR_MARGIN_TOP, current_width, BAR_HEIGHT))
+
+        if phase2:
+            label_rect = self.phase_label.get_rect(
+                midtop=(WIDTH / 2, BAR_MARGIN_TOP + BAR_HEIGHT + 5)
+            )
+            layer.blit(self.phase_label, label_rect)
+
+        for i in range(self.max_hearts):
+            heart = self.heart_full if i < hearts else self.heart_empty
+            layer.blit(heart, (10 + i * (HEART_SIZE + HEART_SPACING), 10))
+
+    def draw(self, surface, boss, hearts):
+        state = (boss.health, boss.phase2, hearts)
+        if state != self._state:
+            self._state = state
+            self._render(*state)
+        surface.blit(self.layer, (0, 0))
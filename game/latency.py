@@ -0,0 +1,79 @@
+import time
+import asyncio
+from collections import deque
+import pygame
+
+INPUT_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN,
+                          pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION))
+
+class LatencyMonitor:
+    """Measures how long input takes to reach the screen.
+
+    pygame events carry no timestamps, so they are stamped when taken off the
+    queue. watch() keeps taking them off every couple of milliseconds between
+    frames, so a stamp is within that of the event's arrival. Every flip records
+    two latencies: from the oldest input event handled that frame, and from when
+    held keys and aim were last sampled into the controls. Given a GCPolicy, it
+    also records the time each frame spent collecting garbage.
+    """
+    def __init__(self, history=3600, gc_policy=None):
+        self.gc_policy = gc_policy
+        self.pending = []  # (stamp, event) taken off the queue but not handled yet
+        self.oldest_input = None  # Stamp of the oldest input event handled this frame
+        self.sampled = None  # When controls were last sampled this frame
+        self.input_to_flip = deque(maxlen=history)
+        self.sample_to_flip = deque(maxlen=history)
+        self.gc_pause = deque(maxlen=history)
+
+    def collect(self):
+        """Take waiting events off the queue, stamped with the time they were seen"""
+        events = pygame.event.get()
+        if events:
+            now = time.perf_counter()
+            self.pending.extend((now, event) for event in events)
+
+    def waiting(self):
+        """Whether any event is waiting, taken off the queue or not; a FrameScheduler wake check"""
+        return bool(self.pending or pygame.event.peek())
+
+    async def watch(self, scheduler, interval=0.002):
+        """Background task collecting events every interval until the scheduler stops"""
+        while scheduler.running:
+            self.collect()
+            await asyncio.sleep(interval)
+
+    def events(self):
+        """Every event since the last call; use in place of pygame.event.get()"""
+        self.collect()
+        pending, self.pending = self.pending, []
+        for stamp, event in pending:
+            if event.type in INPUT_EVENTS and (self.oldest_input is None or stamp < self.oldest_input):
+                self.oldest_input = stamp
+        return [event for _, event in pending]
+
+    def sampled_now(self):
+        self.sampled = time.perf_counter()
+
+    def flipped(self):
+        now = time.perf_counter()
+        if self.oldest_input is not None:
+            self.input_to_flip.append(now - self.oldest_input)
+        if self.sampled is not None:
+            self.sample_to_flip.append(now - self.sampled)
+        self.oldest_input = self.sampled = None
+        if self.gc_policy is not None:
+            self.gc_pause.append(self.gc_policy.take_pause())
+
+    def summary(self):
+        lines = []
+        for name, samples in (("input event to flip", self.input_to_flip),
+                              ("controls sampled to flip", self.sample_to_flip),
+                              ("garbage collection per frame", self.gc_pause)):
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            lines.append(f"{name}: mean {sum(ordered) / len(ordered) * 1000:.1f} ms, "
+                         f"p50 {ordered[len(ordered) // 2] * 1000:.1f} ms, "
+                         f"p95 {ordered[int(len(ordered) * 0.95)] * 1000:.1f} ms, "
+                         f"max {ordered[-1] * 1000:.1f} ms over {len(ordered)} frames")
+        return "\n".join(lines)
@@ -22,20 +22,15 @@ class Player(pygame.sprite.Sprite):
         self.damage_flash_time = 0
         self.original_image = self.image.copy()
         self.debug_invulnerable = False  # Add debug flag
+        self.time = 0  # Drives the invulnerability flicker
 
-    def update(self, dt):
-        keys = pygame.key.get_pressed()
+    def update(self, dt, controls):
+        self.time += dt
         dx = dy = 0
 
         if not self.rolling:
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx = -self.speed
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx = self.speed
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                dy = -self.speed
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                dy = self.speed
+            dx = controls.move_x * self.speed
+            dy = controls.move_y * self.speed
 
             move_vector = pygame.math.Vector2(dx, dy)
             if move_vector.length() != 0:
@@ -70,7 +65,7 @@ class Player(pygame.sprite.Sprite):
         
         # Make player flash when invulnerable
         if (self.invulnerable_timer > 0 or self.rolling or self.post_roll_invulnerable > 0):
-            if int(pygame.time.get_ticks() / 100) % 2:
+            if int(self.time * 10) % 2:
                 self.image.set_alpha(128)
             else:
                 self.image.set_alpha(255)
@@ -84,6 +79,23 @@ class Player(pygame.sprite.Sprite):
         if self.roll_cooldown > 0:
             self.roll_cooldown -= dt
 
+    def __getstate__(self):
+        # Surfaces don't pickle; both images are a solid fill, so keep fill color and alpha
+        state = self.__dict__.copy()
+        for name in ('image', 'original_image'):
+            image = state[name]
+            state[name] = (image.get_size(), tuple(image.get_at((0, 0)))[:3], image.get_alpha())
+        return state
+
+    def __setstate__(self, state):
+        for name in ('image', 'original_image'):
+            size, color, alpha = state[name]
+            image = pygame.Surface(size)
+            image.fill(color)
+            image.set_alpha(alpha)
+            state[name] = image
+        self.__dict__.update(state)
+
     def take_damage(self):
         if self.debug_invulnerable:
             return False
@@ -103,11 +115,16 @@ class Player(pygame.sprite.Sprite):
     def can_roll(self):
         return not self.rolling and self.roll_cooldown <= 0
 
+    def start_roll(self):
+        self.rolling = True
+        self.roll_timer = 0.35
+        self.roll_direction = self.last_dir.copy()
+        self.image.fill(self.roll_color)
+
     def reset(self):
         """Reset player to initial state"""
         # Reset position
-        self.rect.centerx = WIDTH/2
-        self.rect.bottom = HEIGHT - 50
+        self.rect.center = (WIDTH/2, HEIGHT - 50)  # Where the fight first places it
         
         # Reset state
         self.hearts = 3
@@ -119,6 +136,7 @@ class Player(pygame.sprite.Sprite):
         self.invulnerable_timer = 0
         self.post_roll_invulnerable = 0
         self.damage_flash_time = 0
+        self.time = 0
         
         # Reset appearance
         self.image.fill(self.base_color)
@@ -0,0 +1,76 @@
+import json
+from .settings import FPS
+from .controls import Controls
+from .simulation import Simulation
+from .statehash import StateHashes, HASH_FORMAT
+
+class Replay:
+    """A fight as its RNG seed plus the controls of every simulation tick.
+
+    A fresh Simulation(seed=replay.seed), started and stepped at 1/FPS with these
+    controls, plays the fight back exactly. hashes, when recorded, holds the
+    state hash after every tick to check that it does.
+    """
+    def __init__(self, seed, ticks=None, hashes=None):
+        self.seed = seed
+        self.ticks = ticks if ticks is not None else []  # (move_x, move_y, fire, aim_x, aim_y, roll) per tick
+        self.hashes = hashes
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def record(self, controls):
+        self.ticks.append((controls.move_x, controls.move_y, int(controls.fire),
+                           controls.aim_x, controls.aim_y, int(controls.roll)))
+
+    def apply(self, tick, controls):
+        """Load one tick's recorded controls into controls"""
+        move_x, move_y, fire, aim_x, aim_y, roll = self.ticks[tick]
+        controls.move_x = move_x
+        controls.move_y = move_y
+        controls.fire = bool(fire)
+        controls.aim_x = aim_x
+        controls.aim_y = aim_y
+        controls.roll = bool(roll)
+        return controls
+
+    def save(self, path):
+        data = {"seed": self.seed, "fps": FPS, "ticks": self.ticks}
+        if self.hashes is not None:
+            data["hash_format"] = HASH_FORMAT
+            data["hashes"] = self.hashes.ticks
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("fps", FPS) != FPS:
+            raise ValueError(f"{path} was recorded at {data['fps']} ticks per second, not {FPS}")
+        # Hashes from another hash format can't be compared; the controls still replay
+        hashes = StateHashes(data["hashes"]) if data.get("hash_format") == HASH_FORMAT else None
+        return cls(data["seed"], [tuple(tick) for tick in data["ticks"]], hashes)
+
+def demo_controls(sim, tick, controls):
+    """Scripted play: strafe along the bottom, fire at the boss, roll now and then"""
+    controls.move_x = (-1, 0, 1, 0)[tick // 45 % 4]
+    controls.move_y = 0
+    controls.fire = True
+    controls.aim_x, controls.aim_y = round(sim.boss.pos.x, 2), round(sim.boss.pos.y, 2)
+    controls.roll = tick % 150 == 75
+    return controls
+
+def demo_replay(seconds, seed):
+    """Record a scripted fight played by demo_controls"""
+    sim = Simulation(seed=seed)
+    sim.start()
+    replay = Replay(seed)
+    controls = Controls()
+    for tick in range(int(seconds * FPS)):
+        replay.record(demo_controls(sim, tick, controls))
+        result = sim.step(1 / FPS, controls)
+        sim.events.clear()
+        if result:
+            break
+    return replay
@@ -0,0 +1,149 @@
+import sys
+import time
+import asyncio
+
+# Frame stages, run in this order every frame
+INPUT, UPDATE, RENDER = range(3)
+STAGES = (INPUT, UPDATE, RENDER)
+
+WAKE_SLICE = 0.02  # Seconds between input checks while throttled
+
+class FrameScheduler:
+    """Runs each frame's input, update and render tasks in order, then yields the frame.
+
+    Every stage is its own task looping on `while await scheduler.stage(X): ...;
+    scheduler.done(X)`. Between frames the scheduler hands the event loop back: in
+    the browser with a bare yield so pygbag can return to requestAnimationFrame,
+    on desktop by sleeping until the next frame is due. Background tasks wait on
+    idle() and run in that gap, so loading never holds up a stage.
+
+    throttle() drops to a lower frame rate for screens that rarely change. On
+    desktop a throttled gap ends early once wake() reports waiting input; in the
+    browser, animation frames are skipped until the next frame is due.
+    """
+    def __init__(self, fps, wake=None):
+        self.full_frame_time = self.frame_time = 1 / fps
+        self.wake = wake
+        self.browser = sys.platform == 'emscripten'
+        self.running = True
+        self.dt = self.frame_time
+        self.frame = 0
+        self._loop = asyncio.get_running_loop()
+        self._turns = [self._loop.create_future() for _ in STAGES]
+        self._done = None
+        self._idle = self._loop.create_future()
+        self._last = time.perf_counter()
+        self._next = self._last
+        self._frame_start = self._last
+
+    def spawn(self, coro):
+        """Start a stage or background task; its failure stops the scheduler with the error"""
+        task = self._loop.create_task(coro)
+        task.add_done_callback(self._task_finished)
+        return task
+
+    def _task_finished(self, task):
+        if task.cancelled() or task.exception() is None:
+            return
+        self.running = False
+        if self._done is not None and not self._done.done():
+            self._done.set_exception(task.exception())
+
+    async def stage(self, index):
+        """Wait for this stage's turn in the next frame; False once the scheduler stops"""
+        return await self._turns[index]
+
+    def done(self, index):
+        """Hand the frame on to the next stage"""
+        self._turns[index] = self._loop.create_future()
+        self._done.set_result(None)
+
+    async def idle(self):
+        """Wait for the gap after the current frame is rendered"""
+        await asyncio.shield(self._idle)
+
+    def time_left(self):
+        """Seconds left in the current frame's budget"""
+        return self.frame_time - (time.perf_counter() - self._frame_start)
+
+    def stop(self):
+        self.running = False
+
+    def throttle(self, fps=None):
+        """Run at fps from the next frame, or at full rate with None.
+
+        The current frame's dt is clamped to the new frame time, so leaving a
+        throttled screen doesn't start with a catch-up step.
+        """
+        frame_time = 1 / fps if fps else self.full_frame_time
+        if frame_time != self.frame_time:
+            self.frame_time = frame_time
+            self.dt = min(self.dt, frame_time)
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.dt = min(now - self._last, 0.25)  # Don't let a stall turn into one huge step
+        self._last = self._frame_start = now
+
+    async def _yield(self):
+        if self.browser:
+            await asyncio.sleep(0)
+            if self.frame_time > self.full_frame_time:
+                # Throttled: let animation frames go by until this one is due
+                while time.perf_counter() - self._last < self.frame_time and self.running:
+                    await asyncio.sleep(0)
+            return
+        self._next += self.frame_time
+        delay = self._next - time.perf_counter()
+        if delay < -self.frame_time:
+            self._next = time.perf_counter()  # Too far behind, don't try to catch up
+        if self.wake is None or self.frame_time <= self.full_frame_time:
+            await asyncio.sleep(max(delay, 0))
+            return
+        # Throttled: nap in short slices and start the frame as soon as input arrives
+        while delay > 0 and self.running:
+            await asyncio.sleep(min(delay, WAKE_SLICE))
+            if self.wake():
+                self._next = time.perf_counter()
+                return
+            delay = self._next - time.perf_counter()
+
+    async def run(self):
+        while self.running:
+            self._tick()
+            for index in STAGES:
+                self._done = self._loop.create_future()
+                self._turns[index].set_result(True)
+                await self._done
+            self.frame += 1
+            idle, self._idle = self._idle, self._loop.create_future()
+            idle.set_result(None)
+            await self._yield()
+        # Release the stage tasks
+        for turn in self._turns:
+            if not turn.done():
+                turn.set_result(False)
+        idle, self._idle = self._idle, self._loop.create_future()
+        idle.set_result(None)
+
+class FixedTicker:
+    """Converts variable frame times into a whole number of fixed simulation ticks"""
+    def __init__(self, tick, max_ticks=4):
+        self.tick = tick
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        # Snap frame times within 2ms of the tick so a 60Hz display doesn't alternate 0 and 2 ticks
+        if abs(dt - self.tick) < 0.002:
+            dt = self.tick
+        self.accumulator += dt
+        ticks = int(self.accumulator / self.tick)
+        self.accumulator -= ticks * self.tick
+        if ticks > self.max_ticks:
+            ticks = self.max_ticks
+            self.accumulator = 0.0  # Drop the backlog rather than spiral
+        return ticks
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -3,6 +3,43 @@ import pygame
 # --- Global Constants ---
 WIDTH, HEIGHT = 768, 768
 FPS = 60
+IDLE_FPS = 10  # Title, death and win screens; they also wake early on input
+HIDDEN_FPS = 2  # While the window is minimized or the browser tab hidden; the fight pauses
+
+# Internal render resolution as a fraction of WIDTH/HEIGHT (0.5 renders at 384x384).
+# The world is drawn at this size and upscaled once per frame.
+RENDER_SCALE = 1.0
+
+# Move boss and player bullets analytically from their spawn tick instead of stepping each one
+BULLET_TRAJECTORIES = True
+
+# Add bullet glows onto the scene instead of alpha blending them
+BULLET_ADDITIVE_GLOW = False
+
+# Run the simulation in a worker process that publishes state through shared memory (desktop only)
+SIMULATION_PROCESS = False
+
+# Save each fight's seed, per-tick controls and state hashes here, for tools/render_fight.py
+# and tools/check_determinism.py (None to disable)
+REPLAY_DIR = None
+
+# Accumulate bullet density and player hit heatmaps of in-process fights and export them here on exit
+# (needs NumPy; None to disable)
+HEATMAP_DIR = None
+
+# Re-sample movement and aim right before every simulation tick instead of once at the start of the frame
+LATE_INPUT = False
+
+# Measure input-to-flip latency and print a summary on exit (polls the event queue every 2ms between frames)
+LATENCY_MONITOR = False
+
+# Keep garbage collection out of combat frames: automatic collection is off while fighting and
+# collections run between frames, in full only during safe windows (game/gcpolicy.py)
+GC_POLICY = True
+
+# Bosses in the fight. More than one is a stress test: every boss runs its own attacks into the
+# shared bullet fields and the first one must be defeated to win (in-process only; see tools/stress.py)
+STRESS_BOSSES = 1
 
 # Colors
 WHITE   = (255, 255, 255)
@@ -20,3 +57,6 @@ collision_height = int(HEIGHT * COLLISION_RATIO)
 collision_x = (WIDTH - collision_width) // 2
 collision_y = (HEIGHT - collision_height) // 2
 COLLISION_RECT = pygame.Rect(collision_x, collision_y, collision_width, collision_height)
+
+# Event log level: "debug", "info", "warning" or "off"
+LOG_LEVEL = "off"
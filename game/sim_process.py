@@ -0,0 +1,296 @@
+import sys
+import time
+import queue
+try:
+    import multiprocessing
+    from multiprocessing import shared_memory
+except ImportError:  # Not available in the browser build
+    multiprocessing = None
+    shared_memory = None
+
+from .settings import WIDTH, HEIGHT, FPS
+from .controls import Controls
+from .player import Player
+from .boss import Boss
+from .bullet import blit_batches
+from .events import EventBus, NUM_KINDS
+from .simulation import Simulation
+
+MAX_BULLETS = 4096
+
+# Header slots, shared by both buffers: buffer bookkeeping and the latest controls
+FRONT = 0    # Latest completed buffer, -1 before the first publish
+READING = 1  # Buffer the renderer is reading, -1 for none
+MOVE_X, MOVE_Y, FIRE, AIM_X, AIM_Y, ROLLS = 2, 3, 4, 5, 6, 7
+HEADER_SIZE = 8
+
+# Per-buffer state slots, followed by MAX_BULLETS records of BULLET_FIELDS floats
+STATE_FIELDS = (
+    'tick', 'player_x', 'player_y', 'player_r', 'player_g', 'player_b', 'player_a', 'hearts',
+    'boss_x', 'boss_y', 'boss_r', 'boss_g', 'boss_b', 'health', 'phase2', 'intro',
+    'in_gauntlet', 'melee_flash', 'is_pulsing', 'corner_scale',
+    'corner_exploded_0', 'corner_exploded_1', 'corner_exploded_2', 'corner_exploded_3',
+    'boss_time', 'bullet_count',
+)
+STATE_SIZE = len(STATE_FIELDS)
+BULLET_COUNT = STATE_FIELDS.index('bullet_count')
+BULLET_FIELDS = 6  # x, y, radius, r, g, b
+BUFFER_SIZE = STATE_SIZE + MAX_BULLETS * BULLET_FIELDS
+
+def available():
+    return shared_memory is not None and sys.platform != 'emscripten'
+
+def _buffer_start(index):
+    return HEADER_SIZE + index * BUFFER_SIZE
+
+def _publish(data, sim, tick):
+    """Write the simulation into the back buffer and flip it to the front; False if it was busy"""
+    back = 1 - int(data[FRONT]) if data[FRONT] >= 0 else 0
+    if data[READING] == back:
+        return False  # Renderer still holds it; publish on a later tick
+    base = _buffer_start(back)
+    player, boss = sim.player, sim.boss
+    r, g, b, _ = player.image.get_at((0, 0))
+    state = (
+        tick, player.rect.x, player.rect.y, r, g, b, player.image.get_alpha() or 255, player.hearts,
+        boss.pos.x, boss.pos.y, *boss.current_color, boss.health, boss.phase2, boss.state == "intro",
+        boss.in_gauntlet, boss.melee_flash_timer, boss.is_pulsing, boss.corner_pulse_scale,
+        *boss.corner_exploded, boss.time,
+    )
+    for i, value in enumerate(state):
+        data[base + i] = value
+
+    i = base + STATE_SIZE
+    end = i + MAX_BULLETS * BULLET_FIELDS
+    for field in (sim.boss_bullets, sim.player_bullets):
+        xs, ys = field.positions()
+        columns = field.archetype.columns
+        for x, y, size, color in zip(xs, ys, columns['size'], columns['color']):
+            if i >= end:
+                break
+            data[i] = x
+            data[i + 1] = y
+            data[i + 2] = size
+            data[i + 3] = color[0]
+            data[i + 4] = color[1]
+            data[i + 5] = color[2]
+            i += BULLET_FIELDS
+    data[base + BULLET_COUNT] = (i - base - STATE_SIZE) // BULLET_FIELDS
+    data[FRONT] = back
+    return True
+
+def _run_worker(shm_name, commands, outbox):
+    """Worker process: fixed-tick simulation publishing into shared memory"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    data = shm.buf.cast('d')
+
+    # Forward every event to the render process, which owns the consumers
+    forwarded = []
+    events = EventBus()
+    for kind in range(NUM_KINDS):
+        events.subscribe(kind, lambda a, b, c, d, kind=kind: forwarded.append((kind, a, b, c, d)))
+
+    sim = Simulation(events)
+    controls = Controls()
+    rolls_seen = 0
+    playing = False
+    tick = 0
+    tick_time = 1 / FPS
+    next_tick = time.perf_counter()
+    command = None
+    try:
+        while True:
+            try:
+                while True:
+                    if command is None:
+                        command = commands.get_nowait()
+                    if command == "quit":
+                        return
+                    if command == "start":
+                        sim.start()
+                    elif command == "reset":
+                        sim.reset()
+                        playing = False
+                    elif command == "play":
+                        playing = True
+                    elif command == "pause":
+                        playing = False
+                    command = None
+            except queue.Empty:
+                pass
+
+            result = None
+            if playing:
+                controls.move_x = int(data[MOVE_X])
+                controls.move_y = int(data[MOVE_Y])
+                controls.fire = bool(data[FIRE])
+                controls.aim_x = data[AIM_X]
+                controls.aim_y = data[AIM_Y]
+                rolls = int(data[ROLLS])
+                controls.roll = rolls != rolls_seen
+                rolls_seen = rolls
+                result = sim.step(tick_time, controls)
+                tick += 1
+                if result:
+                    playing = False
+            published = _publish(data, sim, tick)
+
+            events.drain()
+            if forwarded or result:
+                outbox.put((forwarded, result))
+                forwarded = []
+
+            if not playing and published:
+                # Nothing to simulate until the render side sends a command
+                command = commands.get()
+                next_tick = time.perf_counter()
+                continue
+            next_tick += tick_time
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -0.25:
+                next_tick = time.perf_counter()  # Too far behind, don't try to catch up
+    finally:
+        data.release()
+        shm.close()
+
+class SimulationProcess:
+    """Runs the Simulation in a worker process and mirrors its latest published state.
+
+    The worker ticks at FPS and writes player, boss and bullet state into the back
+    half of a double-buffered shared memory block, then flips it to the front. The
+    renderer marks the front buffer as being read and draws straight out of it; the
+    worker skips publishing rather than write into the buffer being read.
+    Events the worker emits are forwarded and re-emitted on the render side's bus.
+    """
+    runs_own_clock = True  # The worker ticks at FPS; step() once per frame just syncs
+
+    def __init__(self, events):
+        self.events = events
+        self.shm = shared_memory.SharedMemory(create=True, size=(HEADER_SIZE + 2 * BUFFER_SIZE) * 8)
+        self.data = self.shm.buf.cast('d')
+        self.data[FRONT] = -1
+        self.data[READING] = -1
+        self.commands = multiprocessing.Queue()
+        self.outbox = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_run_worker, args=(self.shm.name, self.commands, self.outbox), daemon=True
+        )
+        self.process.start()
+
+        # Render-side copies of the player and boss, updated from each snapshot
+        self.player = Player(WIDTH/2, HEIGHT - 50)
+        self.boss = Boss(WIDTH/2, 100)
+        self.bosses = [self.boss]  # Always one; stress fights with more run in-process
+        self._buffer = -1
+        self._rolls = 0
+        self._playing = False
+
+    def start(self):
+        self.commands.put("start")
+
+    def reset(self):
+        self.commands.put("reset")
+        self._playing = False
+        self.events.clear()  # Anything the last fight forwarded and nobody drained
+
+    def pause(self):
+        """Stop the worker ticking; the next step() resumes it"""
+        if self._playing:
+            self.commands.put("pause")
+            self._playing = False
+
+    def step(self, dt, controls):
+        """Hand controls to the worker and pick up its events and latest state"""
+        if not self._playing:
+            self.commands.put("play")
+            self._playing = True
+        data = self.data
+        data[MOVE_X] = controls.move_x
+        data[MOVE_Y] = controls.move_y
+        data[FIRE] = controls.fire
+        data[AIM_X] = controls.aim_x
+        data[AIM_Y] = controls.aim_y
+        if controls.roll:
+            self._rolls += 1
+            data[ROLLS] = self._rolls
+
+        result = None
+        try:
+            while True:
+                forwarded, outcome = self.outbox.get_nowait()
+                for event in forwarded:
+                    self.events.emit(*event)
+                if outcome:
+                    result = outcome
+                    self._playing = False
+        except queue.Empty:
+            pass
+
+        self._acquire()
+        if self._buffer >= 0:
+            self._apply_state()
+        return result
+
+    def _acquire(self):
+        # Mark the front buffer as being read, retrying if the worker flipped meanwhile
+        data = self.data
+        while True:
+            front = int(data[FRONT])
+            data[READING] = front
+            if int(data[FRONT]) == front:
+                break
+        self._buffer = front
+
+    def _apply_state(self):
+        base = _buffer_start(self._buffer)
+        state = dict(zip(STATE_FIELDS, self.data[base:base + STATE_SIZE].tolist()))
+        player, boss = self.player, self.boss
+
+        player.rect.topleft = (state['player_x'], state['player_y'])
+        player.image.fill((state['player_r'], state['player_g'], state['player_b']))
+        player.image.set_alpha(int(state['player_a']))
+        player.hearts = int(state['hearts'])
+
+        boss.pos.update(state['boss_x'], state['boss_y'])
+        boss.current_color = [state['boss_r'], state['boss_g'], state['boss_b']]
+        boss.health = state['health']
+        boss.phase2 = bool(state['phase2'])
+        boss.state = "intro" if state['intro'] else "idle"
+        boss.in_gauntlet = bool(state['in_gauntlet'])
+        boss.melee_flash_timer = state['melee_flash']
+        boss.is_pulsing = bool(state['is_pulsing'])
+        boss.corner_pulse_scale = state['corner_scale']
+        boss.hazards.pulse(boss.corner_pulse_scale - 1)  # The scale is 1 + the flash amount
+        boss.corner_exploded = [bool(state[f'corner_exploded_{i}']) for i in range(4)]
+        boss.time = state['boss_time']
+
+    def draw_bosses(self, camera):
+        self.boss.draw(camera)
+
+    def draw_bullets(self, camera):
+        if self._buffer < 0:
+            return
+        self.boss.hazards.draw(camera)
+        data = self.data
+        base = _buffer_start(self._buffer)
+        start = base + STATE_SIZE
+        end = start + int(data[base + BULLET_COUNT]) * BULLET_FIELDS
+        batches = {}
+        for i in range(start, end, BULLET_FIELDS):
+            key = ((int(data[i + 3]), int(data[i + 4]), int(data[i + 5])), int(data[i + 2]))
+            batch = batches.get(key)
+            if batch is None:
+                batch = batches[key] = []
+            batch.append((data[i], data[i + 1]))
+        blit_batches(camera, batches)
+
+    def close(self):
+        self.commands.put("quit")
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.data.release()
+        self.shm.close()
+        self.shm.unlink()
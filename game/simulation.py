@@ -0,0 +1,204 @@
+import io
+import math
+import pickle
+import random
+import pygame
+from .settings import WIDTH, HEIGHT, BULLET_TRAJECTORIES, STRESS_BOSSES
+from .player import Player
+from .boss import Boss
+from .bullet import Bullet, BulletField, draw_bullets
+from .entities import World, HITBOX, HANDLE, sync_hitboxes, collide
+from .events import EventBus, HIT, PHASE_CHANGE, SOUND
+
+class Simulation:
+    """The fight itself: player, boss and both bullet fields, advanced one step at a time.
+
+    Bullets, and the player's and bosses' hit boxes, are entities in one store;
+    each step syncs the boxes and the collision system tests each bullet field
+    against the boxes it can hit.
+
+    Input is passed in as Controls and side effects go out through the event bus,
+    so the same simulation runs in the game loop, in a worker process or headless.
+
+    With bosses > 1 it is a stress test: the extra bosses run their own attacks
+    into the same bullet fields, with their own corner hazards, and are hit by
+    the same player bullets. The first boss is the one on the health bar and
+    defeating it wins the fight; an extra boss that is defeated stops acting
+    until the next reset.
+    """
+    runs_own_clock = False  # The caller decides how many steps to run per frame
+
+    def __init__(self, events=None, seed=None, trajectory=BULLET_TRAJECTORIES, bosses=STRESS_BOSSES):
+        self.events = events if events is not None else EventBus()
+        self.rng = random.Random(seed)  # All fight randomness, so a seed replays the same fight
+        self.player = Player(WIDTH/2, HEIGHT - 50)
+        self.boss = Boss(WIDTH/2, 100, self.events, self.rng)
+        self.bosses = [self.boss]
+        for i in range(1, bosses):
+            # Extras settle on a ring around the centre instead of on top of the first boss
+            angle = 2 * math.pi * i / bosses
+            extra = Boss(WIDTH/2 + math.cos(angle) * WIDTH/4, 100, self.events, self.rng)
+            extra.intro_target_pos += (math.cos(angle) * WIDTH/4, math.sin(angle) * HEIGHT/4)
+            self.bosses.append(extra)
+        # Both bullet fields and the hit boxes they collide with are archetypes in one entity store
+        self.world = World()
+        self.boss_bullets = BulletField(trajectory, self.world, "boss_bullets")
+        self.player_bullets = BulletField(trajectory, self.world, "player_bullets")
+        self.player_hitbox = self.world.archetype("player_hitbox", HITBOX, HANDLE)
+        self.boss_hitboxes = self.world.archetype("boss_hitboxes", HITBOX, HANDLE)
+        no_box = {'left': 0, 'top': 0, 'right': 0, 'bottom': 0}
+        self.world.spawn(self.player_hitbox, {**no_box, 'handle': self.player})
+        for boss in self.bosses:
+            self.world.spawn(self.boss_hitboxes, {**no_box, 'handle': boss})
+        self.player_fire_delay = 0.2
+        self.player_fire_timer = 0
+
+    def start(self):
+        """Begin the fight from the title screen"""
+        self.player.hearts = 3
+        for boss in self.bosses:
+            boss.health = 700
+            boss.state = "intro"
+            boss.intro_timer = 3.0
+            boss.pos = boss.intro_start_pos.copy()
+
+    def reset(self):
+        """Reset player, boss and bullets for another attempt"""
+        self.player.reset()
+        for boss in self.bosses:
+            boss.reset()
+        self.boss_bullets.empty()
+        self.player_bullets.empty()
+        self.player_fire_timer = 0
+        self.events.clear()  # Anything the last fight emitted and nobody drained
+
+    def step(self, dt, controls):
+        """Advance one step; returns "death", "win" or None"""
+        player = self.player
+        events = self.events
+
+        if controls.roll and player.can_roll() and player.last_dir.length() != 0:
+            player.start_roll()
+
+        player.update(dt, controls)
+
+        if not player.rolling:
+            if controls.fire:
+                self.player_fire_timer -= dt
+                if self.player_fire_timer <= 0:
+                    direction = pygame.math.Vector2(controls.aim_x, controls.aim_y) - pygame.math.Vector2(player.rect.center)
+                    if direction.length() != 0:
+                        direction = direction.normalize()
+                    bullet_speed = 10
+                    velocity = direction * bullet_speed
+                    bullet = Bullet(player.rect.center, velocity, color=player.base_color, radius=5)
+                    self.player_bullets.add(bullet)
+                    events.emit(SOUND, "player_gun")
+                    self.player_fire_timer = self.player_fire_delay
+            else:
+                self.player_fire_timer = 0
+        else:
+            self.player_fire_timer = 0
+
+        # Move boss update after player input but before collision checks
+        for boss in self.bosses:
+            if boss.health > 0 and boss.update(player, self.boss_bullets, dt) == "death":
+                return "death"
+
+        self.boss_bullets.update()
+        self.player_bullets.update()
+
+        result = None
+
+        sync_hitboxes(self.player_hitbox, _player_rect)
+        sync_hitboxes(self.boss_hitboxes, _boss_rect)
+
+        # Check collisions: player bullets vs. bosses
+        player_bullets = self.player_bullets
+        for boss, bullets in collide(player_bullets.archetype, *player_bullets.positions(), self.boss_hitboxes):
+            if result or boss.health <= 0:
+                continue
+            for bullet in bullets:
+                if bullet.field is None:
+                    continue  # Already spent on a boss tested earlier
+                if not boss.in_gauntlet:
+                    if boss.take_damage() == "win":
+                        if boss is self.boss:
+                            events.emit(PHASE_CHANGE, "defeated")
+                            result = "win"
+                        else:
+                            bullet.kill()  # An extra boss is down; the fight goes on
+                        break
+                    events.emit(HIT, "boss", "bullet", bullet.pos, boss.health)
+                bullet.kill()
+
+        # Check collisions: boss bullets and the static corner hazards vs. player
+        if not player.is_invulnerable():
+            boss_bullets = self.boss_bullets
+            hits = collide(boss_bullets.archetype, *boss_bullets.positions(), self.player_hitbox)
+            for _, bullets in hits:
+                for bullet in bullets:
+                    bullet.kill()
+            collided = bool(hits) or any(
+                boss.hazards.collide(player.rect) for boss in self.bosses if boss.health > 0)
+            if collided:
+                if player.take_damage():
+                    events.emit(HIT, "player", "bullet", player.rect.center, player.hearts)
+                    if player.hearts <= 0:
+                        events.emit(PHASE_CHANGE, "game_over")
+                        result = "death"
+
+        return result
+
+    def draw_bosses(self, camera):
+        for boss in self.bosses:
+            if boss.health > 0:
+                boss.draw(camera)
+
+    def draw_bullets(self, camera):
+        for boss in self.bosses:
+            if boss.health > 0:
+                boss.hazards.draw(camera)
+        draw_bullets(camera, self.boss_bullets)
+        draw_bullets(camera, self.player_bullets)
+
+    def snapshot(self):
+        """Pickled fight state, without the event bus and its subscribers"""
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, self.events).dump(self)
+        return buffer.getvalue()
+
+    @staticmethod
+    def restore(data, events=None):
+        """Simulation from a snapshot(), emitting on events (a fresh bus if None)"""
+        events = events if events is not None else EventBus()
+        return _SnapshotUnpickler(io.BytesIO(data), events).load()
+
+    def pause(self):
+        pass  # The in-process fight only advances when stepped
+
+    def close(self):
+        pass  # Nothing to release for an in-process simulation
+
+def _player_rect(player):
+    return player.rect
+
+def _boss_rect(boss):
+    return pygame.Rect(boss.pos.x - boss.radius, boss.pos.y - boss.radius, boss.radius*2, boss.radius*2)
+
+class _SnapshotPickler(pickle.Pickler):
+    # The bus is swapped out for a placeholder and swapped back in on restore
+    def __init__(self, file, events):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.events = events
+
+    def persistent_id(self, obj):
+        return "events" if obj is self.events else None
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, events):
+        super().__init__(file)
+        self.events = events
+
+    def persistent_load(self, pid):
+        return self.events
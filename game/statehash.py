@@ -0,0 +1,102 @@
+import math
+import zlib
+import struct
+from hashlib import blake2b
+from operator import mul
+
+# Floats are hashed as multiples of 1/QUANTUM, so implementations that differ
+# only in rounding noise (stepped versus analytic bullets) hash the same
+QUANTUM = 4096
+RNG_INTERVAL = 30  # Ticks between RNG state hashes; getstate() costs more than the rest together
+HASH_FORMAT = 2  # Saved with recorded hashes; bump when what or how state is hashed changes
+
+# Hashed groups of state, in the order they are stored per tick
+FIELDS = ("player", "boss", "timers", "rng", "boss_bullets", "player_bullets")
+
+def _q(value):
+    return round(value * QUANTUM)
+
+def _fingerprint(layout, *values):
+    # Builtin hash() differs between CPython versions and 32 and 64-bit builds (the
+    # web build is wasm32), so state is packed little-endian and hashed with BLAKE2b
+    return int.from_bytes(blake2b(struct.pack(layout, *values), digest_size=8).digest(), "little")
+
+def _text(value):
+    # str hashes are salted per process; crc32 is the same in every run
+    return zlib.crc32(value.encode()) if value is not None else -1
+
+def _bullets(field):
+    """Order-independent checksum of a bullet field.
+
+    Rows are ordered by spawns and removals, which differ between
+    implementations, so columns are reduced with fsum, whose result is the
+    correctly rounded sum whatever the order.
+    """
+    xs, ys = field.positions()
+    if not xs:
+        return 0
+    columns = field.archetype.columns
+    fsum = math.fsum
+    return _fingerprint("<7q", len(xs), *[round(total * QUANTUM) for total in (
+        fsum(xs), fsum(ys), fsum(map(mul, xs, ys)),
+        fsum(columns['vx']), fsum(columns['vy']), fsum(columns['radius']))])
+
+def state_hashes(sim, rng=0):
+    """One hash per FIELDS group of a Simulation's current state; rng is passed through"""
+    player, boss = sim.player, sim.boss
+    timers = [round(timer * QUANTUM) for timer in (
+        player.roll_timer, player.roll_cooldown, player.invulnerable_timer, player.post_roll_invulnerable,
+        sim.player_fire_timer, boss.state_timer, boss.attack_cooldown, boss.intro_timer, boss.charge_time,
+        boss.gauntlet_timer, boss.gauntlet_fire_timer, boss.melee_cooldown, boss.wave_timer,
+        boss.corner_pulse_timer, boss.time, *boss.explosion_delays)]
+    return (
+        _fingerprint("<6q", player.rect.x, player.rect.y, player.hearts, player.rolling,
+                     _q(player.last_dir.x), _q(player.last_dir.y)),
+        _fingerprint("<9q4?", _q(boss.pos.x), _q(boss.pos.y), boss.health,
+                     _text(boss.state), _text(boss.current_attack),
+                     boss.phase2, boss.in_gauntlet, boss.is_pulsing, len(boss.pending_waves),
+                     *boss.corner_exploded),
+        _fingerprint(f"<{len(timers)}q", *timers),
+        rng,
+        _bullets(sim.boss_bullets),
+        _bullets(sim.player_bullets),
+    )
+
+class StateHashes:
+    """Per-tick state hashes of a run, plus a running digest of all of them.
+
+    The RNG is hashed every RNG_INTERVAL ticks and carried over in between, so a
+    divergence that only shows in its draws is reported up to that late.
+    """
+    def __init__(self, ticks=None):
+        self.ticks = []  # One FIELDS-ordered tuple per tick
+        self.digest = 0
+        self.rng = 0
+        for hashes in ticks or ():
+            self.append(tuple(hashes))
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def append(self, hashes):
+        self.ticks.append(hashes)
+        self.digest = _fingerprint("<7Q", self.digest, *hashes)
+
+    def record(self, sim):
+        """Hash sim after a tick"""
+        if len(self.ticks) % RNG_INTERVAL == 0:
+            # Only the Mersenne Twister words and position; the Gaussian cache is None
+            self.rng = _fingerprint("<625I", *sim.rng.getstate()[1])
+        self.append(state_hashes(sim, self.rng))
+
+def first_divergence(a, b):
+    """(tick, differing fields) where two runs' hashes first differ, or None if they match.
+
+    A run that ends early diverges at its length, with no fields.
+    """
+    if a.digest == b.digest and len(a) == len(b):
+        return None
+    for tick, (mine, theirs) in enumerate(zip(a.ticks, b.ticks)):
+        if mine != theirs:
+            return tick, [name for name, x, y in zip(FIELDS, mine, theirs) if x != y]
+    return min(len(a), len(b)), []
@@ -1,7 +1,8 @@
 import pygame
 import random
 import math
-from .settings import RED, WHITE
+from .settings import WHITE
+from .entities import World, TRANSFORM, VELOCITY, RENDERABLE, LIFETIME, move, expire
 
 def draw_heart(surface, x, y, size, color):
     r = size // 4
@@ -12,17 +13,6 @@ def draw_heart(surface, x, y, size, color):
     point3 = (int(x + size/2), int(y - r/2))
     pygame.draw.polygon(surface, color, [point1, point2, point3])
 
-def draw_hearts(surface, hearts, max_hearts=3):
-    heart_size = 30
-    spacing = 5
-    for i in range(max_hearts):
-        pos_x = 10 + i*(heart_size + spacing) + heart_size//2
-        pos_y = 10 + heart_size//2
-        if i < hearts:
-            draw_heart(surface, pos_x, pos_y, heart_size, RED)
-        else:
-            draw_heart(surface, pos_x, pos_y, heart_size, (100, 100, 100))
-
 class ScreenShake:
     def __init__(self):
         self.duration = 0
@@ -33,6 +23,10 @@ class ScreenShake:
         self.duration = duration
         self.intensity = intensity
 
+    def stop(self):
+        self.duration = 0
+        self.offset = pygame.math.Vector2(0, 0)
+
     def update(self, dt):
         if self.duration > 0:
             self.duration -= dt
@@ -43,52 +37,58 @@ class ScreenShake:
                 self.offset = pygame.math.Vector2(0, 0)
         return self.offset
 
-class Impact(pygame.sprite.Sprite):
-    def __init__(self, pos, color=WHITE):
-        super().__init__()
-        self.pos = pygame.math.Vector2(pos)
-        self.lifetime = 0.2  # Effect lasts 0.2 seconds
-        self.particles = []
-        
+# Particle dots shared by all impacts, faded per impact with set_alpha
+_particle_cache = {}
+
+def particle_sprite(size, color, scale=1.0):
+    key = (size, color, scale)
+    image = _particle_cache.get(key)
+    if image is None:
+        size = max(1, int(size * scale))
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(image, color, (size//2, size//2), size//2)
+        _particle_cache[key] = image
+    return image
+
+IMPACT_LIFETIME = 0.2  # Effect lasts 0.2 seconds
+IMPACT = (TRANSFORM, VELOCITY, RENDERABLE, LIFETIME)
+
+class Impacts:
+    """Impact sparks, stored as particle entities and updated a column at a time"""
+    def __init__(self, world=None):
+        self.world = world if world is not None else World()
+        self.particles = self.world.archetype("impact_particles", *IMPACT)
+
+    def __len__(self):
+        return len(self.particles)
+
+    def spawn(self, pos, color=WHITE):
         # Create 8 particles in a star pattern
+        x, y = pos
         for angle in range(0, 360, 45):
             speed = random.uniform(2, 5)
             rad = math.radians(angle + random.uniform(-10, 10))
-            velocity = pygame.math.Vector2(
-                speed * math.cos(rad),
-                speed * math.sin(rad)
-            )
-            size = random.randint(2, 4)
-            self.particles.append({
-                'pos': self.pos.copy(),
-                'vel': velocity,
-                'size': size,
-                'alpha': 255
+            self.world.spawn(self.particles, {
+                'x': x, 'y': y, 'vx': speed * math.cos(rad), 'vy': speed * math.sin(rad),
+                'color': color, 'size': random.randint(2, 4), 'lifetime': IMPACT_LIFETIME,
             })
 
     def update(self, dt):
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.kill()
-            return
+        expire(self.particles, dt)
+        move(self.particles)
 
-        fade_speed = 255 / 0.2  # Fade from 255 to 0 over lifetime
-        
-        for p in self.particles:
-            p['pos'] += p['vel']
-            p['alpha'] = max(0, p['alpha'] - fade_speed * dt)
+    def empty(self):
+        self.particles.clear()
 
-    def draw(self, surface):
-        for p in self.particles:
-            alpha = int(p['alpha'])
+    def draw(self, camera):
+        surface = camera.surface
+        columns = self.particles.columns
+        for x, y, color, size, lifetime in zip(columns['x'], columns['y'], columns['color'],
+                                               columns['size'], columns['lifetime']):
+            # Fade from 255 to 0 over the lifetime
+            alpha = int(255 * lifetime / IMPACT_LIFETIME)
             if alpha <= 0:
                 continue
-                
-            particle_surface = pygame.Surface((p['size'], p['size']), pygame.SRCALPHA)
-            pygame.draw.circle(
-                particle_surface,
-                (*WHITE, alpha),
-                (p['size']//2, p['size']//2),
-                p['size']//2
-            )
-            surface.blit(particle_surface, p['pos'])
+            image = particle_sprite(size, color, camera.scale)
+            image.set_alpha(alpha)
+            surface.blit(image, camera.point((x, y)))
@@ -4,15 +4,26 @@
 # ///
 
 import asyncio
-import pygame
+import os
 import random
+import time
+import pygame
 import sys
-from game.settings import WIDTH, HEIGHT, FPS
-from game.player import Player
-from game.boss import Boss
-from game.bullet import Bullet
-from game.utils import draw_hearts, ScreenShake, Impact
+from game.settings import (WIDTH, HEIGHT, FPS, IDLE_FPS, HIDDEN_FPS, LOG_LEVEL, SIMULATION_PROCESS, REPLAY_DIR, HEATMAP_DIR,
+                           LATE_INPUT, LATENCY_MONITOR, GC_POLICY, STRESS_BOSSES)
+from game.camera import Camera
+from game.controls import Controls, poll_controls, latch_controls
+from game.simulation import Simulation
+from game.hud import Hud
+from game.utils import Impacts
 from game.ui import Button, draw_title_screen, draw_death_screen, draw_win_screen
+from game.events import EventBus, EventLogger, AudioPlayer, HitEffects
+from game.assets import asset_path
+from game.replay import Replay
+from game.statehash import StateHashes
+from game.latency import LatencyMonitor
+from game.gcpolicy import GCPolicy
+from game.scheduler import FrameScheduler, FixedTicker, INPUT, UPDATE, RENDER
 
 if sys.platform == 'emscripten':
     try:
@@ -22,268 +33,346 @@ if sys.platform == 'emscripten':
     except Exception as e:
         print("Platform setup failed:", e)
 
+def page_hidden():
+    """Whether the browser tab is in the background; SDL has no window event for it"""
+    try:
+        return bool(platform.window.document.hidden)
+    except Exception:
+        return False
+
+HIDE_EVENTS = (pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED)
+SHOW_EVENTS = (pygame.WINDOWSHOWN, pygame.WINDOWRESTORED, pygame.WINDOWEXPOSED)
+
 async def main():
-    pygame.init()
+    # Only what the title screen needs is set up before its first frame; load_game()
+    # builds the fight in the frame gaps after it, and the mixer waits for the first click
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Boss Battle Simulation")
-    clock = pygame.time.Clock()
+    # Garbage collection runs between frames, and in full only when nothing is flying
+    gc_policy = GCPolicy() if GC_POLICY else None
+
+    # Input-to-flip latency, stamped as events come off the queue, and GC time per frame
+    latency = LatencyMonitor(gc_policy=gc_policy) if LATENCY_MONITOR else None
+
+    # Throttled screens wake as soon as input is waiting; the latency monitor takes events
+    # off the queue as they arrive, so with it on they wait in its buffer instead
+    scheduler = FrameScheduler(FPS, wake=latency.waiting if latency is not None else pygame.event.peek)
+
+    # Camera owns the view offset; the world is drawn through it at RENDER_SCALE
+    camera = Camera(screen)
+
+    # Sounds are decoded one per frame gap after the first click, while the game runs
+    sound_files = {
+        'player_gun': "sfx/player_gun.ogg",
+        'boss_explosion': "sfx/green_gun.ogg",
+        'yellow_gun': "sfx/yellow_gun.ogg",
+        'laser': "sfx/lazer.ogg",
+        'red_gun': "sfx/red_gun.ogg",
+        'machine_gun': "sfx/machine_gun.ogg"
+    }
 
-    # Load background image from assets/art folder
-    try:
-        bg = pygame.image.load("assets/art/background.jpg").convert()
-    except:
-        print("Error loading background image")
-        bg = pygame.Surface((WIDTH, HEIGHT))
-        bg.fill((0, 0, 0))
-    bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
-
-    # Create a function to load sounds after user interaction
     async def load_sounds():
         try:
-            sounds = {
-                'player_gun': "assets/sfx/player_gun.ogg",
-                'boss_explosion': "assets/sfx/green_gun.ogg", 
-                'yellow_gun': "assets/sfx/yellow_gun.ogg",
-                'laser': "assets/sfx/lazer.ogg",
-                'red_gun': "assets/sfx/red_gun.ogg",
-                'machine_gun': "assets/sfx/machine_gun.ogg"
-            }
-            
-            loaded_sounds = {}
-            for name, path in sounds.items():
-                try:
-                    sound = pygame.mixer.Sound(path)
-                    sound.set_volume(0.3)  # Default volume
-                    loaded_sounds[name] = sound
-                except Exception as e:
-                    print(f"Failed to load sound {name}: {e}")
-                    loaded_sounds[name] = None
-                
-            return loaded_sounds
-        except Exception as e:
-            print(f"Error in load_sounds: {e}")
-            return {}
-
-    # Initialize sound variables
-    player_gun_sound = None
-    boss_explosion_sound = None
-    yellow_gun_sound = None
-    laser_sound = None
-    red_gun_sound = None
-    machine_gun_sound = None
-    sounds_loaded = False
-
-    all_sprites = pygame.sprite.Group()
-    boss_bullets = pygame.sprite.Group()
-    player_bullets = pygame.sprite.Group()
-    impact_sprites = pygame.sprite.Group()
-
-    player = Player(WIDTH/2, HEIGHT - 50)
-    all_sprites.add(player)
-    boss = Boss(WIDTH/2, 100)
-    boss.explosion_sound = boss_explosion_sound
-    boss.yellow_gun_sound = yellow_gun_sound
-    boss.laser_sound = laser_sound
-    boss.red_gun_sound = red_gun_sound
-    boss.machine_gun_sound = machine_gun_sound
-
-    player_fire_delay = 0.2
-    player_fire_timer = 0
-
-    screen_shake = ScreenShake()
-    render_offset = pygame.math.Vector2(0, 0)
-    
-    game_surface = pygame.Surface((WIDTH, HEIGHT))
-
-    boss.start_game(boss_bullets)
+            pygame.mixer.init()
+        except pygame.error as e:
+            print("Audio setup failed:", e)
+            return
+        for name, path in sound_files.items():
+            await scheduler.idle()
+            if not scheduler.running:
+                return
+            try:
+                sound = pygame.mixer.Sound(asset_path(path))
+                sound.set_volume(0.3)  # Default volume
+                audio.sounds[name] = sound
+            except Exception as e:
+                print(f"Failed to load sound {name}: {e}")
+        if gc_policy is not None:
+            gc_policy.loaded()
+
+    sound_loader = None
+
+    impacts = Impacts()
+
+    # Gameplay code emits events; logging, audio and effects consume them once per frame
+    events = EventBus()
+    EventLogger(events, LOG_LEVEL)
+    audio = AudioPlayer(events)
+    HitEffects(events, camera.shake, impacts)
+
+    controls = Controls()
 
     game_state = "title"  # Can be "title", "playing", "death" or "win"
-    
-    # Create buttons for death screen
-    button_width = 200
-    button_height = 50
-    button_y = HEIGHT * 2/3
-    retry_button = Button(
-        WIDTH/2 - button_width - 20, button_y,
-        button_width, button_height,
-        "Try Again"
-    )
-    exit_button = Button(
-        WIDTH/2 + 20, button_y,
-        button_width, button_height,
-        "Exit"
-    )
-    death_buttons = [retry_button, exit_button]
-
-    running = True
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            
-            if game_state == "title":
-                if event.type == pygame.MOUSEBUTTONDOWN and not sounds_loaded:
-                    # Load sounds after first click
-                    sound_dict = await load_sounds()
-                    player_gun_sound = sound_dict.get('player_gun')
-                    boss_explosion_sound = sound_dict.get('boss_explosion')
-                    yellow_gun_sound = sound_dict.get('yellow_gun')
-                    laser_sound = sound_dict.get('laser')
-                    red_gun_sound = sound_dict.get('red_gun')
-                    machine_gun_sound = sound_dict.get('machine_gun')
-                    
-                    # Update boss sounds
-                    boss.explosion_sound = boss_explosion_sound
-                    boss.yellow_gun_sound = yellow_gun_sound
-                    boss.laser_sound = laser_sound
-                    boss.red_gun_sound = red_gun_sound
-                    boss.machine_gun_sound = machine_gun_sound
-                    sounds_loaded = True
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    game_state = "playing"
-                    # Reset game state if needed
-                    player.hearts = 3
-                    boss.health = 700
-                    boss.state = "intro"
-                    boss.intro_timer = 3.0
-                    boss.pos = boss.intro_start_pos.copy()
-            
-            elif game_state == "death":
-                if retry_button.handle_event(event):
-                    game_state = "playing"
-                    # Reset game state
-                    player.reset()
-                    boss.reset()
-                    # Clear all bullets
-                    boss_bullets.empty()
-                    player_bullets.empty()
-                elif exit_button.handle_event(event):
-                    running = False
-            
-            elif game_state == "win":
-                draw_win_screen(screen)
-                # Optional: Add a way to restart or exit
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
+    start_requested = False  # Clicked on the title screen; starts once load_game() is done
+    window_hidden = False
+    hidden = False  # Window minimized or tab in the background: pause and skip rendering
+    drawn = None  # What the menu screen on display shows; None when it needs drawing
+
+    # Built by load_game() after the first frame
+    bg = None
+    sim = player = boss = None
+    hud = None
+    retry_button = exit_button = None
+    death_buttons = []
+    heatmaps = None  # Bullet density and player hits of in-process fights, exported on exit
+
+    async def load_game():
+        """Build everything the title screen doesn't need, a piece per frame gap"""
+        nonlocal bg, sim, player, boss, hud, retry_button, exit_button, death_buttons, heatmaps
+        await scheduler.idle()
+        if not scheduler.running:
+            return
+        # Load background image from assets/art folder
+        try:
+            bg = pygame.image.load(asset_path("art/background.jpg")).convert()
+        except:
+            print("Error loading background image")
+            bg = pygame.Surface((WIDTH, HEIGHT))
+            bg.fill((0, 0, 0))
+        bg = camera.fit_background(bg)
+
+        await scheduler.idle()
+        if not scheduler.running:
+            return
+        # The fight runs in-process, or in a worker process publishing through shared memory
+        # (which only carries one boss, so stress fights stay in-process)
+        if SIMULATION_PROCESS and STRESS_BOSSES == 1:
+            from game import sim_process  # Imports multiprocessing, so only when enabled
+            if sim_process.available():
+                sim = sim_process.SimulationProcess(events)
+        if sim is None:
+            sim = Simulation(events)
+        player = sim.player
+        boss = sim.boss
+        if HEATMAP_DIR and not sim.runs_own_clock:
+            from game import heatmap  # Imports NumPy, so only when enabled
+            if heatmap.available():
+                heatmaps = heatmap.Heatmaps(events)
+
+        await scheduler.idle()
+        if not scheduler.running:
+            return
+        hud = Hud(max_hearts=3)
+        # Create buttons for death screen
+        button_width = 200
+        button_height = 50
+        button_y = HEIGHT * 2/3
+        retry_button = Button(
+            WIDTH/2 - button_width - 20, button_y,
+            button_width, button_height,
+            "Try Again"
+        )
+        exit_button = Button(
+            WIDTH/2 + 20, button_y,
+            button_width, button_height,
+            "Exit"
+        )
+        death_buttons = [retry_button, exit_button]
+
+        # Everything alive now stays alive; take it out of garbage collection
+        if gc_policy is not None:
+            gc_policy.loaded()
+
+    # Fights can be recorded as seed plus controls, with state hashes to check playback against
+    replay = None
+
+    def begin_fight():
+        nonlocal replay
+        # Shake and sparks from the end of the last fight
+        camera.shake.stop()
+        impacts.empty()
+        if REPLAY_DIR and not sim.runs_own_clock:
+            seed = random.randrange(2**32)
+            sim.rng.seed(seed)
+            replay = Replay(seed, hashes=StateHashes())
+
+    def end_fight():
+        nonlocal replay
+        if replay is not None:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            replay.save(os.path.join(REPLAY_DIR, time.strftime("fight-%Y%m%d-%H%M%S.json")))
+            replay = None
+
+    async def input_stage():
+        nonlocal game_state, start_requested, sound_loader, window_hidden, hidden, drawn
+        while await scheduler.stage(INPUT):
+            for event in (latency.events() if latency is not None else pygame.event.get()):
+                if event.type == pygame.QUIT:
+                    scheduler.stop()
+                elif event.type in HIDE_EVENTS:
+                    window_hidden = True
+                elif event.type in SHOW_EVENTS:
+                    window_hidden = False
+                    drawn = None  # The window contents may be gone
+
+                if game_state == "title":
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        if sound_loader is None:
+                            # Browsers only allow audio after a user gesture
+                            sound_loader = scheduler.spawn(load_sounds())
+                        start_requested = True
+
+                elif game_state == "death":
+                    if retry_button.handle_event(event):
+                        game_state = "playing"
+                        # Reset player, boss and bullets
+                        sim.reset()
+                        begin_fight()
+                    elif exit_button.handle_event(event):
+                        scheduler.stop()
+
+                elif game_state == "win":
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                        # Reset game state
+                        game_state = "title"
+                        sim.reset()
+
+                elif game_state == "playing":
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_SPACE:
-                            # Reset game state
-                            game_state = "title"
-                            player.reset()
-                            boss.reset()
-                            boss_bullets.empty()
-                            player_bullets.empty()
-            
+                            controls.roll = True
+
+            # A failed load stops the scheduler and is raised from the gather below
+            if start_requested and game_loader.done() and game_loader.exception() is None:
+                start_requested = False
+                game_state = "playing"
+                sim.start()
+                begin_fight()
+
+            was_hidden = hidden
+            hidden = window_hidden or (scheduler.browser and page_hidden())
+            if hidden and not was_hidden and sim is not None:
+                sim.pause()
+            elif was_hidden and not hidden:
+                drawn = None
+
+            if hidden:
+                scheduler.throttle(HIDDEN_FPS)
             elif game_state == "playing":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE and player.can_roll():
-                        if player.last_dir.length() != 0:
-                            player.rolling = True
-                            player.roll_timer = 0.35
-                            player.roll_direction = player.last_dir.copy()
-                            player.image.fill(player.roll_color)
-
-        # Clear screen at start of frame
-        screen.fill((0, 0, 0))
-
-        if game_state == "title":
-            draw_title_screen(screen)
-        
-        elif game_state == "death":
-            draw_death_screen(screen, death_buttons)
-        
-        elif game_state == "win":
-            draw_win_screen(screen)
-        
-        elif game_state == "playing":
-            # Update game logic only when playing
-            all_sprites.update(dt)
-            
-            if not player.rolling:
-                mouse_pressed = pygame.mouse.get_pressed()[0]
-                if mouse_pressed:
-                    player_fire_timer -= dt
-                    if player_fire_timer <= 0:
-                        mouse_pos = pygame.mouse.get_pos()
-                        direction = pygame.math.Vector2(mouse_pos) - pygame.math.Vector2(player.rect.center)
-                        if direction.length() != 0:
-                            direction = direction.normalize()
-                        bullet_speed = 10
-                        velocity = direction * bullet_speed
-                        bullet = Bullet(player.rect.center, velocity, color=player.base_color, radius=5)
-                        player_bullets.add(bullet)
-                        if player_gun_sound and sounds_loaded:
-                            try:
-                                player_gun_sound.play()
-                            except Exception as e:
-                                print(f"Error playing sound: {e}")
-                        player_fire_timer = player_fire_delay
-                else:
-                    player_fire_timer = 0
+                scheduler.throttle(None)
+                poll_controls(controls)
+                if latency is not None:
+                    latency.sampled_now()
             else:
-                player_fire_timer = 0
+                scheduler.throttle(IDLE_FPS)
+            scheduler.done(INPUT)
+
+    async def update_stage():
+        # The in-process fight advances in fixed ticks whatever the frame rate
+        nonlocal game_state
+        ticker = FixedTicker(1 / FPS)
+        while await scheduler.stage(UPDATE):
+            if game_state == "playing" and not hidden:
+                ticks = 1 if sim.runs_own_clock else ticker.advance(scheduler.dt)
+                for _ in range(ticks):
+                    if LATE_INPUT:
+                        latch_controls(controls)
+                        if latency is not None:
+                            latency.sampled_now()
+                    if replay is not None:
+                        replay.record(controls)
+                    result = sim.step(ticker.tick, controls)
+                    controls.roll = False
+                    if replay is not None:
+                        replay.hashes.record(sim)
+                    if heatmaps is not None:
+                        heatmaps.sample(sim)
+                    if result:
+                        game_state = result
+                        # The render stage only drains while playing; the last tick's hit,
+                        # phase change and sounds belong to this fight
+                        events.drain()
+                        end_fight()
+                        break
+            if game_state != "playing" or hidden:
+                ticker.reset()
+            scheduler.done(UPDATE)
 
-            # Move boss update after player input but before collision checks
-            boss_state = boss.update(player, boss_bullets, dt)
-            if boss_state == "death":
-                game_state = "death"
+    async def render_stage():
+        nonlocal drawn
+        while await scheduler.stage(RENDER):
+            dt = scheduler.dt
+            # Menus only change with the state and button hover; otherwise their last frame stays up
+            view = (game_state, *[button.is_hovered for button in death_buttons])
+            if hidden or view == drawn:
+                scheduler.done(RENDER)
                 continue
 
-            boss_bullets.update()
-            player_bullets.update()
-
-            # Update screen shake
-            render_offset = screen_shake.update(dt)
-
-            # Update impacts
-            impact_sprites.update(dt)
-
-            # Check collisions: player bullets vs. boss
-            boss_rect = pygame.Rect(boss.pos.x - boss.radius, boss.pos.y - boss.radius, boss.radius*2, boss.radius*2)
-            for bullet in player_bullets:
-                if boss_rect.colliderect(bullet.rect):
-                    if not boss.in_gauntlet:
-                        result = boss.take_damage()
-                        if result == "win":
-                            game_state = "win"
-                            break
-                        if random.random() < 0.3:
-                            impact = Impact(bullet.pos)
-                            impact_sprites.add(impact)
-                    bullet.kill()
-
-            # Check collisions: boss bullets vs. player
-            if not player.is_invulnerable():
-                collided = pygame.sprite.spritecollide(player, boss_bullets, True)
-                if collided:
-                    if player.take_damage():
-                        print("Player hit! Hearts left:", player.hearts)
-                        screen_shake.start_shake(0.2, 10.0)
-                        if player.hearts <= 0:
-                            print("Game Over!")
-                            game_state = "death"
-
-            # Draw game elements
-            game_surface.blit(bg, (0, 0))
-            all_sprites.draw(game_surface)
-            boss.draw(game_surface)
-            boss_bullets.draw(game_surface)
-            player_bullets.draw(game_surface)
-            
-            for impact in impact_sprites:
-                impact.draw(game_surface)
-            
-            draw_hearts(game_surface, player.hearts, max_hearts=3)
-            
-            # Draw game_surface to screen with shake offset
-            screen.blit(game_surface, render_offset)
-
-        pygame.display.flip()
-        await asyncio.sleep(0)
+            if game_state == "title":
+                draw_title_screen(screen)
+
+            elif game_state == "death":
+                draw_death_screen(screen, death_buttons)
+
+            elif game_state == "win":
+                screen.fill((0, 0, 0))
+                draw_win_screen(screen)
+
+            elif game_state == "playing":
+                # Update screen shake
+                camera.update(dt)
+
+                # Update impacts
+                impacts.update(dt)
+
+                # Dispatch this frame's events to the log, audio and effects consumers
+                events.drain()
+
+                # Draw game elements
+                camera.draw_background(bg)
+                camera.blit(player.image, player.rect.topleft)
+                sim.draw_bosses(camera)
+                sim.draw_bullets(camera)
+
+                impacts.draw(camera)
+
+                # Upscale the world when rendering below window resolution
+                camera.present()
+
+                # HUD is drawn at window resolution on top of the world
+                hud.draw(screen, boss, player.hearts)
+
+            pygame.display.flip()
+            if latency is not None:
+                latency.flipped()
+            drawn = view if game_state != "playing" else None
+            scheduler.done(RENDER)
+
+    async def collect_garbage():
+        while scheduler.running:
+            await scheduler.idle()
+            gc_policy.combat(game_state == "playing" and not hidden)
+            # Safe windows: nothing is being fired at the player
+            safe = not gc_policy.in_combat or boss.state == "intro" or boss.intermission_delay > 0
+            gc_policy.idle(safe, scheduler.time_left())
+
+    stages = [scheduler.spawn(input_stage()), scheduler.spawn(update_stage()), scheduler.spawn(render_stage())]
+    game_loader = scheduler.spawn(load_game())
+    stages.append(game_loader)
+    if gc_policy is not None:
+        stages.append(scheduler.spawn(collect_garbage()))
+    if latency is not None:
+        stages.append(scheduler.spawn(latency.watch(scheduler)))
+    try:
+        await scheduler.run()
+        await asyncio.gather(*stages)
+    finally:
+        game_loader.cancel()
+        if sound_loader is not None:
+            sound_loader.cancel()
+        end_fight()
+        if heatmaps is not None:
+            heatmaps.export(HEATMAP_DIR)
+        if latency is not None:
+            print(latency.summary())
+        if gc_policy is not None:
+            gc_policy.close()
 
+    if sim is not None:
+        sim.close()
     pygame.quit()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
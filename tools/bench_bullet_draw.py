@@ -0,0 +1,70 @@
+"""Bullet draw cost per 1,000 bullets: one blit per bullet vs. batched blits per glow sprite.
+
+Run from the repository root:  python tools/bench_bullet_draw.py [bullet counts...]
+"""
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from game.settings import WIDTH, HEIGHT, PURPLE, RED, GREEN, YELLOW, BLUE
+from game.bullet import Bullet, BulletField, draw_bullets, _render_glow
+from game.camera import Camera
+
+# Color and radius mix seen during a phase 2 fight
+KINDS = [(PURPLE, 5), (RED, 5), (GREEN, 3), (YELLOW, 5), (BLUE, 5)]
+FRAMES = 100
+
+def make_field(count):
+    field = BulletField()
+    for _ in range(count):
+        color, radius = random.choice(KINDS)
+        pos = (random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+        field.add(Bullet(pos, (0, 0), color, radius))
+    return field
+
+def per_bullet(camera, field):
+    # Previous path: every bullet owns its surface and is blitted on its own. Positions
+    # come from the same columns the batched path reads, so only the blits differ
+    sprites = [(image, image.get_width() // 2)
+               for image in (_render_glow(bullet.color, bullet.radius) for bullet in field)]
+    def draw():
+        surface = camera.surface
+        xs, ys = field.positions()
+        for (image, half), x, y in zip(sprites, xs, ys):
+            surface.blit(image, (int(x) - half, int(y) - half))
+    return draw
+
+def time_draw(camera, draw):
+    draw()  # Warm sprite caches
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        camera.surface.fill((0, 0, 0))
+        draw()
+    return (time.perf_counter() - start) / FRAMES
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 3000]
+    pygame.init()
+    random.seed(0)
+    camera = Camera(pygame.Surface((WIDTH, HEIGHT)), 1.0)
+    # Subtract the per-frame clear so only bullet drawing is measured
+    clear = time_draw(camera, lambda: None)
+    print(f"{'bullets':>8} {'per-bullet':>12} {'batched':>12} {'additive':>12}   (ms per 1,000 bullets)")
+    for count in counts:
+        field = make_field(count)
+        results = [
+            time_draw(camera, per_bullet(camera, field)),
+            time_draw(camera, lambda: draw_bullets(camera, field, additive=False)),
+            time_draw(camera, lambda: draw_bullets(camera, field, additive=True)),
+        ]
+        row = " ".join(f"{(t - clear) * 1000 * 1000 / count:12.3f}" for t in results)
+        print(f"{count:>8} {row}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Stage the game for pygbag with pruned, recompressed and content-hashed assets.
+
+Run from the repository root:  python tools/build_web.py [out_dir]   (default build/staging)
+then build the bundle with:    pygbag --build build/staging
+
+Only the audio format the web build loads is kept, the background JPEG is resized
+to the window and re-encoded under a target size (needs Pillow; the build fails
+if a JPEG is left over the target), and every asset is written under
+a content-hashed name listed in assets/manifest.json, so the files can be cached
+indefinitely while the manifest itself stays small and uncached.
+"""
+import os
+import io
+import sys
+import json
+import shutil
+import hashlib
+import importlib.util
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from game.settings import WIDTH, HEIGHT
+from game.assets import ASSET_DIR, MANIFEST
+
+WEB_AUDIO_FORMAT = ".ogg"  # Format main.py loads; the .wav masters stay out of the bundle
+AUDIO_FORMATS = (".ogg", ".wav", ".mp3")
+JPEG_TARGET_BYTES = 48 * 1024
+CODE = ["main.py", "game"]
+
+# Connection profiles for download time estimates, in bytes per second
+PROFILES = [("3G", 1.6e6 / 8), ("4G", 12e6 / 8), ("broadband", 50e6 / 8)]
+
+def content_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}"
+
+def encode_jpeg(path, size, target_bytes):
+    """Resize to the window and re-encode, lowering quality until under target_bytes"""
+    image = pygame.transform.scale(pygame.image.load(path), size)
+    try:
+        from PIL import Image
+    except ImportError:
+        # pygame can't set JPEG quality; settle for the resize
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, "image.jpg")
+            pygame.image.save(image, out)
+            with open(out, "rb") as f:
+                return f.read()
+    pil_image = Image.frombytes("RGB", size, pygame.image.tostring(image, "RGB"))
+    data = b""
+    for quality in range(90, 30, -5):
+        buffer = io.BytesIO()
+        pil_image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+        data = buffer.getvalue()
+        if len(data) <= target_bytes:
+            break
+    return data
+
+def process_asset(rel_path):
+    """Bundled bytes for an asset, or None to leave it out"""
+    src = os.path.join(ROOT, ASSET_DIR, rel_path)
+    ext = os.path.splitext(rel_path)[1].lower()
+    if ext in AUDIO_FORMATS and ext != WEB_AUDIO_FORMAT:
+        return None
+    with open(src, "rb") as f:
+        data = f.read()
+    if ext in (".jpg", ".jpeg"):
+        encoded = encode_jpeg(src, (WIDTH, HEIGHT), JPEG_TARGET_BYTES)
+        if len(encoded) < len(data):  # Re-encoding without a quality control can grow the file
+            data = encoded
+        if len(data) > JPEG_TARGET_BYTES:
+            hint = "; install Pillow so it can be re-encoded" if importlib.util.find_spec("PIL") is None else ""
+            sys.exit(f"{rel_path} is {len(data)} bytes, over the {JPEG_TARGET_BYTES} byte target{hint}")
+    return data
+
+def format_time(seconds):
+    return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.1f}s"
+
+def main():
+    out_dir = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, "build", "staging"))
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+    pygame.init()
+
+    # Code is copied as-is
+    rows = []
+    for entry in CODE:
+        src = os.path.join(ROOT, entry)
+        dst = os.path.join(out_dir, entry)
+        if os.path.isdir(src):
+            shutil.copytree(src, dst, ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+            for dirpath, _, files in os.walk(dst):
+                for name in sorted(files):
+                    path = os.path.join(dirpath, name)
+                    rows.append((os.path.relpath(path, out_dir), None, os.path.getsize(path)))
+        else:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copy2(src, dst)
+            rows.append((entry, None, os.path.getsize(dst)))
+
+    manifest = {}
+    skipped = []
+    for dirpath, _, files in os.walk(os.path.join(ROOT, ASSET_DIR)):
+        for name in sorted(files):
+            rel_path = os.path.relpath(os.path.join(dirpath, name), os.path.join(ROOT, ASSET_DIR))
+            rel_path = rel_path.replace(os.sep, "/")
+            original = os.path.getsize(os.path.join(dirpath, name))
+            data = process_asset(rel_path)
+            if data is None:
+                skipped.append((rel_path, original))
+                continue
+            hashed = content_name(rel_path, data)
+            manifest[rel_path] = hashed
+            dst = os.path.join(out_dir, ASSET_DIR, hashed)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            with open(dst, "wb") as f:
+                f.write(data)
+            rows.append((f"{ASSET_DIR}/{hashed}", original, len(data)))
+
+    manifest_path = os.path.join(out_dir, ASSET_DIR, MANIFEST)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    rows.append((f"{ASSET_DIR}/{MANIFEST}", None, os.path.getsize(manifest_path)))
+
+    # Report
+    header = f"{'file':<44} {'source':>9} {'bundled':>9} " + " ".join(f"{name:>9}" for name, _ in PROFILES)
+    print(header)
+    print("-" * len(header))
+    for path, original, size in rows:
+        source = f"{original:>9}" if original is not None else f"{'':>9}"
+        times = " ".join(f"{format_time(size / rate):>9}" for _, rate in PROFILES)
+        print(f"{path:<44} {source} {size:>9} {times}")
+    total = sum(size for _, _, size in rows)
+    print("-" * len(header))
+    times = " ".join(f"{format_time(total / rate):>9}" for _, rate in PROFILES)
+    print(f"{'total':<44} {'':>9} {total:>9} {times}")
+    if skipped:
+        print(f"left out {len(skipped)} files ({sum(size for _, size in skipped)} bytes): "
+              + ", ".join(path for path, _ in skipped))
+    print(f"staged in {out_dir}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Memory budget check for bullets and the phase 2 charge explosion.
+
+Run from the repository root:  python tools/check_memory.py
+Exits with status 1 when a measurement is over its budget.
+"""
+import os
+import sys
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from game.settings import WIDTH, HEIGHT, RED, GREEN
+from game.bullet import Bullet, BulletField, glow_sprite
+from game.boss import Boss
+from game.player import Player
+
+BULLET_COUNT = 5000
+BYTES_PER_BULLET_BUDGET = 400
+CHARGE_PEAK_BUDGET = 160 * 1024
+
+def bytes_per_bullet():
+    field = BulletField()
+    glow_sprite(RED, 5)  # Shared sprite is not per-bullet cost
+    random.seed(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(BULLET_COUNT):
+        pos = (random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+        field.add(Bullet(pos, (random.uniform(-5, 5), random.uniform(-5, 5)), RED, 5))
+    field.positions()  # Position columns are materialized lazily
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / BULLET_COUNT
+
+def charge_explosion_peak():
+    # Phase 2 charge explosion fired from the arena center, run until every wave has spawned
+    boss = Boss(WIDTH / 2, 100, rng=random.Random(0))
+    player = Player(WIDTH / 2, HEIGHT - 50)
+    bullets = BulletField()
+    boss.state = "idle"
+    boss.pos = pygame.math.Vector2(WIDTH / 2, HEIGHT / 2)
+    boss.phase2 = True
+    boss.health_threshold_hit = True
+    boss.attack_cooldown = 0
+    boss.all_attacks = ["charge_attack"]
+    boss.available_attacks = ["charge_attack"]
+    boss.melee_cooldown = 1000  # Keep the scripted fight to the explosion
+    glow_sprite(GREEN, 3)
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    dt = 1 / 60
+    for _ in range(240):
+        boss.update(player, bullets, dt)
+        bullets.update()
+        boss.events.clear()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - base
+
+def main():
+    pygame.init()
+    checks = [
+        ("bytes per live bullet", bytes_per_bullet(), BYTES_PER_BULLET_BUDGET),
+        ("phase 2 charge explosion peak bytes", charge_explosion_peak(), CHARGE_PEAK_BUDGET),
+    ]
+    failed = False
+    for name, value, budget in checks:
+        status = "ok" if value <= budget else "OVER BUDGET"
+        failed |= value > budget
+        print(f"{name:>38}: {value:10.0f}  (budget {budget})  {status}")
+    pygame.quit()
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
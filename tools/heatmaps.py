@@ -0,0 +1,79 @@
+"""Accumulate bullet density and player hit heatmaps over a batch of fights.
+
+Run from the repository root:
+    python tools/heatmaps.py REPLAY.json [REPLAY.json ...] [--out DIR]
+    python tools/heatmaps.py --demo COUNT [--seconds S] [--out DIR]   (scripted fights, seeds 0..COUNT-1)
+
+Every fight is simulated headlessly and sampled each tick into one set of
+histograms per attack and phase, exported as DIR/heatmaps.npz plus an
+occupancy and a hits PNG for each. Needs NumPy.
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game.settings import FPS
+from game.controls import Controls
+from game.events import EventBus
+from game.replay import Replay, demo_replay
+from game.simulation import Simulation
+from game import heatmap
+
+TICK = 1 / FPS
+
+def accumulate(replay, events, heatmaps):
+    """Play one fight, sampling every tick; returns (ticks, seconds spent sampling)"""
+    sim = Simulation(events, seed=replay.seed)
+    sim.start()
+    controls = Controls()
+    sampling = 0.0
+    for tick in range(len(replay)):
+        result = sim.step(TICK, replay.apply(tick, controls))
+        began = time.perf_counter()
+        heatmaps.sample(sim)
+        events.drain()
+        sampling += time.perf_counter() - began
+        if result:
+            return tick + 1, sampling
+    return len(replay), sampling
+
+def main():
+    parser = argparse.ArgumentParser(description="Accumulate bullet and hit heatmaps over recorded fights")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("replays", nargs="*", default=[], help="replay files recorded by the game")
+    source.add_argument("--demo", type=int, metavar="COUNT", help="run this many scripted fights instead")
+    parser.add_argument("--seconds", type=float, default=60, help="length of each --demo fight")
+    parser.add_argument("--out", default=os.path.join(ROOT, "build", "heatmaps"))
+    parser.add_argument("--cell", type=int, default=heatmap.CELL_SIZE, help="histogram cell size in pixels")
+    args = parser.parse_args()
+    if not heatmap.available():
+        sys.exit("heatmaps need NumPy: pip install numpy")
+
+    events = EventBus()
+    heatmaps = heatmap.Heatmaps(events, args.cell)
+    total_ticks = 0
+    sampling = 0.0
+    fights = range(args.demo) if args.demo is not None else args.replays
+    for fight in fights:
+        replay = demo_replay(args.seconds, fight) if args.demo is not None else Replay.load(fight)
+        ticks, spent = accumulate(replay, events, heatmaps)
+        total_ticks += ticks
+        sampling += spent
+        print(f"{fight}: {ticks} ticks")
+
+    paths = heatmaps.export(args.out)
+    print(f"sampled {total_ticks} ticks in {sampling:.2f}s: "
+          f"{sampling / max(total_ticks, 1) * 1e6:.0f} us per tick")
+    for key, ticks in sorted(heatmaps.ticks.items()):
+        hits = heatmaps.hits.get(key)
+        print(f"  {' '.join(key):28} {ticks:7d} ticks  {0 if hits is None else int(hits.sum()):4d} hits")
+    print(f"wrote {len(paths)} files to {args.out}")
+
+if __name__ == "__main__":
+    main()
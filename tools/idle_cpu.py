@@ -0,0 +1,87 @@
+"""Measure the game's CPU use on the title screen, in a fight and while minimized.
+
+Run from the repository root:
+    python tools/idle_cpu.py [--seconds S] [--full-rate]
+
+Runs main.py headlessly and drives it with posted events: it waits on the title
+screen, clicks to start the fight, minimizes the window mid-fight and quits.
+For each phase it prints CPU time as a share of one core and frames run, and
+exits with status 1 when an idle phase is over its CPU budget. --full-rate
+keeps every screen at FPS for comparison and checks no budgets.
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import main as game
+from game.settings import FPS
+
+PHASES = (
+    ("title screen", None),
+    ("fight", pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10), button=1)),
+    ("minimized", pygame.event.Event(pygame.WINDOWMINIMIZED)),
+    ("restored", pygame.event.Event(pygame.WINDOWRESTORED)),
+)
+
+# Share of one core each idle phase may use; fights run at full rate and have none
+CPU_BUDGETS = {
+    "title screen": 0.05,
+    "minimized": 0.05,
+}
+
+async def drive(seconds, frames):
+    await asyncio.sleep(0.5)  # Let main() initialise pygame and settle
+    results = []
+    for name, event in PHASES:
+        if event is not None:
+            pygame.event.post(event)
+        await asyncio.sleep(0.2)
+        wall, cpu, first = time.perf_counter(), time.process_time(), frames()
+        await asyncio.sleep(seconds)
+        wall = time.perf_counter() - wall
+        results.append((name, (time.process_time() - cpu) / wall, (frames() - first) / wall))
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CPU use while idle, fighting and minimized")
+    parser.add_argument("--seconds", type=float, default=3, help="length of each phase")
+    parser.add_argument("--full-rate", action="store_true", help="don't throttle idle or hidden screens")
+    args = parser.parse_args()
+    if args.full_rate:
+        game.IDLE_FPS = game.HIDDEN_FPS = FPS
+
+    # Count frames by wrapping the scheduler's per-frame tick
+    scheduler_class = game.FrameScheduler
+    counter = {"frames": 0}
+    tick = scheduler_class._tick
+    def counting_tick(self):
+        counter["frames"] += 1
+        tick(self)
+    scheduler_class._tick = counting_tick
+
+    async def run():
+        results, _ = await asyncio.gather(drive(args.seconds, lambda: counter["frames"]), game.main())
+        return results
+
+    failed = False
+    for name, cpu, fps in asyncio.run(run()):
+        budget = None if args.full_rate else CPU_BUDGETS.get(name)
+        status = ""
+        if budget is not None:
+            status = f"  (budget {budget * 100:.0f}%)  " + ("ok" if cpu <= budget else "OVER BUDGET")
+            failed |= cpu > budget
+        print(f"{name:14} {cpu * 100:5.1f}% CPU  {fps:5.1f} frames/s{status}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Render a recorded fight offline to an image sequence, split across a process pool.
+
+Run from the repository root:
+    python tools/render_fight.py REPLAY.json [--out DIR] [--size PX] [--format png|raw] [--workers N]
+    python tools/render_fight.py --demo SECONDS [...]   (scripted fight, saved as DIR/replay.json)
+
+Replays are recorded by the game when REPLAY_DIR is set. The fight is simulated
+once headlessly, taking a state snapshot before every chunk of frames. Each
+worker restores the snapshot for its chunk a short pre-roll early, so screen shake
+and impact sparks already in flight match, then renders its frames as
+frame_000000.png, or .rgb (raw RGB24, size x size). Render-side randomness is
+reseeded per frame, so the output doesn't depend on how frames are split.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import multiprocessing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")  # Let the pool terminate workers
+
+import pygame
+from game.settings import WIDTH, HEIGHT, FPS
+from game.assets import asset_path
+from game.camera import Camera
+from game.controls import Controls
+from game.events import EventBus, HitEffects
+from game.hud import Hud
+from game.replay import Replay, demo_replay
+from game.simulation import Simulation
+from game.utils import Impacts
+
+TICK = 1 / FPS
+CHUNK = 240  # Frames per pool job
+PREROLL = 30  # Ticks simulated before a chunk; longer than any shake or impact lasts
+
+def take_snapshots(replay):
+    """Play the fight once, snapshotting PREROLL ticks before every chunk; returns (snapshots, frames)"""
+    sim = Simulation(seed=replay.seed)
+    sim.start()
+    controls = Controls()
+    snapshots = {}
+    frames = len(replay)
+    for tick in range(len(replay)):
+        if (tick + PREROLL) % CHUNK == 0 or tick == 0:
+            snapshots[tick] = sim.snapshot()
+        result = sim.step(TICK, replay.apply(tick, controls))
+        sim.events.clear()
+        if result:
+            frames = tick + 1
+            break
+    return snapshots, frames
+
+class Renderer:
+    """Draws the fight the way the game's render stage does, at any square size"""
+    def __init__(self, size):
+        self.camera = Camera(pygame.Surface((size, size)), size / WIDTH)
+        try:
+            background = pygame.image.load(asset_path("art/background.jpg")).convert()
+        except pygame.error:
+            background = pygame.Surface((WIDTH, HEIGHT))
+        self.background = self.camera.fit_background(background)
+        self.hud = Hud(max_hearts=3)
+        self.hud_scratch = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+    def draw(self, sim, impacts):
+        camera = self.camera
+        camera.draw_background(self.background)
+        camera.blit(sim.player.image, sim.player.rect.topleft)
+        sim.draw_bosses(camera)
+        sim.draw_bullets(camera)
+        impacts.draw(camera)
+        # camera.surface is the frame at any size; the HUD is laid out at window size
+        frame = camera.surface
+        self.hud.draw(self.hud_scratch, sim.boss, sim.player.hearts)
+        layer = self.hud.layer
+        if frame.get_width() != WIDTH:
+            scale = frame.get_width() / WIDTH
+            layer = pygame.transform.smoothscale(
+                layer, (round(layer.get_width() * scale), round(layer.get_height() * scale)))
+        frame.blit(layer, (0, 0))
+        return frame
+
+_renderer = None
+
+def _init_worker(size):
+    global _renderer
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert() needs a display
+    _renderer = Renderer(size)
+
+def _frame_seed(seed, tick):
+    return seed * 1_000_003 + tick
+
+def render_chunk(job):
+    """Restore a snapshot, simulate up to the chunk and write its frames"""
+    snapshot, first, start, end, ticks, seed, out_dir, fmt = job
+    began = time.perf_counter()
+    events = EventBus()
+    sim = Simulation.restore(snapshot, events)
+    renderer = _renderer
+    camera = renderer.camera
+    camera.shake.duration = 0
+    impacts = Impacts()
+    HitEffects(events, camera.shake, impacts)
+    replay = Replay(seed, ticks)
+    controls = Controls()
+    to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    for tick in range(first, end):
+        random.seed(_frame_seed(seed, tick))
+        sim.step(TICK, replay.apply(tick - first, controls))
+        camera.update(TICK)
+        impacts.update(TICK)
+        events.drain()
+        if tick < start:
+            continue
+        frame = renderer.draw(sim, impacts)
+        path = os.path.join(out_dir, f"frame_{tick:06d}")
+        if fmt == "png":
+            pygame.image.save(frame, path + ".png")
+        else:
+            with open(path + ".rgb", "wb") as f:
+                f.write(to_bytes(frame, "RGB"))
+    return end - start, time.perf_counter() - began
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a recorded fight to an image sequence")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("replay", nargs="?", help="replay file recorded by the game")
+    source.add_argument("--demo", type=float, metavar="SECONDS", help="render a scripted fight instead")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --demo")
+    parser.add_argument("--out", default=os.path.join(ROOT, "build", "frames"))
+    parser.add_argument("--size", type=int, default=WIDTH, help="output width and height in pixels")
+    parser.add_argument("--format", choices=("png", "raw"), default="png")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    began = time.perf_counter()
+    if args.demo is not None:
+        replay = demo_replay(args.demo, args.seed)
+        replay.save(os.path.join(args.out, "replay.json"))
+    else:
+        replay = Replay.load(args.replay)
+    snapshots, frames = take_snapshots(replay)
+    prepared = time.perf_counter() - began
+
+    jobs = []
+    for start in range(0, frames, CHUNK):
+        first = max(0, start - PREROLL)
+        end = min(start + CHUNK, frames)
+        jobs.append((snapshots[first], first, start, end, replay.ticks[first:end],
+                     replay.seed, args.out, args.format))
+
+    began = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(args.workers, initializer=_init_worker, initargs=(args.size,)) as pool:
+        written = 0
+        for count, _ in pool.imap_unordered(render_chunk, jobs):
+            written += count
+            print(f"\r{written}/{frames} frames", end="", flush=True)
+        pool.close()
+        pool.join()
+    elapsed = time.perf_counter() - began
+    print()
+    print(f"simulated and snapshotted {frames} ticks in {prepared:.2f}s")
+    print(f"rendered {written} frames at {args.size}x{args.size} with {args.workers} workers "
+          f"in {elapsed:.2f}s: {written / elapsed:.1f} frames/s")
+    if args.format == "png":
+        print(f"encode with: ffmpeg -framerate {FPS} -i {args.out}/frame_%06d.png fight.mp4")
+    else:
+        size = max(1, int(WIDTH * (args.size / WIDTH)))
+        print(f"frames are raw RGB24, {size}x{size}")
+
+if __name__ == "__main__":
+    main()
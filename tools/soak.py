@@ -0,0 +1,208 @@
+"""Soak test: many headless fights with restarts, failing if memory or tick cost creeps up.
+
+Run from the repository root:
+    python tools/soak.py [--cycles N] [--seed S] [--no-render]
+
+Cycles follow the game's own flow on one Simulation. A death is retried with
+reset(); a win goes back to the title with reset() and starts again with
+start(). Even cycles are lost by a scripted player. Odd cycles are won with an
+invulnerable one, the boss dropped near the phase 2 threshold and again once
+phase 2 begins, so each covers the gauntlet and both phases in about 20 seconds.
+Every fight of a kind reseeds the RNG with the same seed, so they play out the
+same and their tick cost is comparable. Unless --no-render, every tick is drawn
+as the render stage draws it.
+
+After each restart the boss, player and bullet fields are compared with a
+freshly started Simulation, and live GC objects, surfaces reachable from them,
+RSS and mean tick time are recorded. It fails when a restart leaves state
+behind, when same-seed fights stop lasting the same number of ticks, or when
+the median of the last quarter of cycles is above that of the first quarter
+after warm-up by more than a tolerance.
+"""
+import os
+import gc
+import sys
+import time
+import argparse
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game.settings import WIDTH, HEIGHT, FPS
+from game.camera import Camera
+from game.controls import Controls
+from game.events import EventBus, HitEffects
+from game.hud import Hud
+from game.replay import demo_controls
+from game.simulation import Simulation
+from game.utils import Impacts
+
+TICK = 1 / FPS
+MAX_FIGHT = 120 * FPS  # Ticks before a fight is abandoned
+WARMUP = 0.1  # Share of cycles left out while caches fill
+
+# Allowed growth from the first to the last quarter: (relative, absolute)
+TOLERANCES = {
+    "objects": (0.01, 200),
+    "surfaces": (0, 2),
+    "rss": (0.05, 4 * 1024 * 1024),
+    "death tick": (0.15, 0),  # Mean tick time, per kind of fight
+    "win tick": (0.15, 0),
+}
+
+# Attributes a restart keeps by design, or that don't compare by value
+UNCOMPARED = {"rng", "events", "hazards", "image", "original_image"}
+
+def leftover_state(sim):
+    """Names of boss and player attributes and bullet counts that differ from a fresh fight's"""
+    fresh = Simulation()
+    fresh.start()
+    leftovers = []
+    for name in ("boss", "player"):
+        mine = vars(getattr(sim, name))
+        for key, value in vars(getattr(fresh, name)).items():
+            if key not in UNCOMPARED and not key.startswith("_") and mine.get(key) != value:
+                leftovers.append(f"{name}.{key}")
+    hazards, fresh_hazards = sim.boss.hazards, fresh.boss.hazards
+    if (hazards.positions, hazards.radius, hazards.color) != (fresh_hazards.positions, fresh_hazards.radius, fresh_hazards.color):
+        leftovers.append("boss.hazards")
+    for name in ("boss_bullets", "player_bullets"):
+        if len(getattr(sim, name)) != len(getattr(fresh, name)):
+            leftovers.append(f"len({name})")
+    return leftovers
+
+def rss():
+    """Resident set size in bytes (peak RSS where /proc isn't available)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+def surface_count():
+    """Distinct surfaces referenced from GC-tracked objects; surfaces themselves aren't tracked"""
+    seen = set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface):
+                seen.add(id(ref))
+    return len(seen)
+
+class Screen:
+    """The playing branch of main.py's render stage, drawn to an offscreen window-sized surface"""
+    def __init__(self, events):
+        self.surface = pygame.Surface((WIDTH, HEIGHT))
+        self.camera = Camera(self.surface)
+        self.background = self.camera.fit_background(pygame.Surface((WIDTH, HEIGHT)))
+        self.impacts = Impacts()
+        self.hud = Hud(max_hearts=3)
+        HitEffects(events, self.camera.shake, self.impacts)
+
+    def draw(self, sim):
+        camera = self.camera
+        camera.update(TICK)
+        self.impacts.update(TICK)
+        camera.draw_background(self.background)
+        camera.blit(sim.player.image, sim.player.rect.topleft)
+        sim.draw_bosses(camera)
+        sim.draw_bullets(camera)
+        self.impacts.draw(camera)
+        camera.present()
+        self.hud.draw(self.surface, sim.boss, sim.player.hearts)
+
+def fight(sim, screen, win):
+    """Play until the fight ends; returns (result, ticks, mean seconds per tick)"""
+    sim.player.debug_invulnerable = win
+    controls = Controls()
+    result = None
+    spent = 0.0
+    tick = 0
+    while result is None and tick < MAX_FIGHT:
+        boss = sim.boss
+        if win and boss.state != "intro" and not boss.in_gauntlet:
+            # Just above the phase 2 threshold, then a few hits from the end once it starts
+            boss.health = min(boss.health, 20 if boss.phase2 else 360)
+        began = time.perf_counter()
+        result = sim.step(TICK, demo_controls(sim, tick, controls))
+        if screen is not None:
+            screen.draw(sim)
+        spent += time.perf_counter() - began
+        sim.events.drain()
+        tick += 1
+    sim.player.debug_invulnerable = False
+    return result, tick, spent / tick
+
+def trend(samples, relative, absolute):
+    """(first, last) quarter medians after warm-up, and whether last exceeds the tolerance"""
+    start = int(len(samples) * WARMUP)
+    quarter = max(1, (len(samples) - start) // 4)
+    first = statistics.median(samples[start:start + quarter])
+    last = statistics.median(samples[-quarter:])
+    return first, last, last > first * (1 + relative) + absolute
+
+def main():
+    parser = argparse.ArgumentParser(description="Run fight/restart cycles and check nothing grows")
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-render", action="store_true", help="only run the simulation")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    events = EventBus()
+    sim = Simulation(events)
+    screen = None if args.no_render else Screen(events)
+
+    samples = {name: [] for name in TOLERANCES}
+    lengths = {}  # (result, ticks) seen for each kind of fight
+    leftovers = set()
+    began = time.perf_counter()
+    sim.start()
+    for cycle in range(args.cycles):
+        win = cycle % 2 == 1
+        sim.rng.seed(args.seed)
+        result, ticks, tick_time = fight(sim, screen, win)
+        lengths.setdefault(win, set()).add((result, ticks))
+        if result == "win" or result is None:
+            sim.reset()  # Back to the title screen...
+            sim.start()  # ...and clicked to start again
+        else:
+            sim.reset()  # Try Again
+        leftovers.update(leftover_state(sim))
+
+        gc.collect()
+        samples["objects"].append(len(gc.get_objects()))
+        samples["surfaces"].append(surface_count())
+        samples["rss"].append(rss())
+        samples["win tick" if win else "death tick"].append(tick_time)
+        if cycle % 10 == 0 or cycle == args.cycles - 1:
+            print(f"cycle {cycle:5d} {result or 'timeout':7} {ticks:6d} ticks  "
+                  f"{tick_time * 1000:6.3f} ms/tick  {samples['objects'][-1]:7d} objects  "
+                  f"{samples['surfaces'][-1]:4d} surfaces  {samples['rss'][-1] / 1048576:6.1f} MB",
+                  flush=True)
+
+    print(f"\n{args.cycles} cycles in {time.perf_counter() - began:.0f}s")
+    failed = False
+    for name, (relative, absolute) in TOLERANCES.items():
+        first, last, grew = trend(samples[name], relative, absolute)
+        failed |= grew
+        print(f"{name:10} first quarter {first:14.6g}  last quarter {last:14.6g}  {'GREW' if grew else 'ok'}")
+    for win, seen in sorted(lengths.items()):
+        kind = "win" if win else "death"
+        varied = len(seen) > 1
+        failed |= varied
+        outcomes = ", ".join(f"{result or 'timeout'} after {ticks}" for result, ticks in sorted(seen, key=str))
+        print(f"{kind} fights: {outcomes}  {'VARIED' if varied else 'ok'}")
+    if leftovers:
+        failed = True
+        print(f"left over after restarts: {', '.join(sorted(leftovers))}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
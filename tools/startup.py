@@ -0,0 +1,141 @@
+"""Startup benchmark: time to the first title-screen frame, split by kind of work.
+
+Run from the repository root:
+    python tools/startup.py [--runs N] [--frames F]
+
+Each run starts main.py in a fresh interpreter, so imports are cold, with
+pygame's calls and the game's constructors wrapped in timers. Time up to the
+first display flip is split into:
+
+    import         importing main.py, pygame and the game modules
+    module init    pygame.init() and the pygame.*.init() of single modules
+    window         opening the display
+    asset decode   loading images and sounds and fitting the background
+    construction   the player, boss, bullet fields, HUD, buttons, fonts, effects
+    first draw     drawing the title screen
+    collection     the GC policy's collect and freeze of everything loaded
+    other          everything in between
+
+A timed call inside another is counted with the outer one. The run then goes
+on for F more frames, and work done after the first flip is reported as
+deferred, with the time the last of it finished. Medians over the runs are
+printed. Uses SDL's dummy drivers, so window and audio times are a lower
+bound on a real display.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KINDS = ["import", "module init", "window", "asset decode", "construction", "first draw", "collection", "other"]
+
+def child(frames):
+    """Run main.py, printing the timings of this run as JSON"""
+    began = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import main
+    import pygame
+    imported = time.perf_counter()
+
+    spent = {kind: 0.0 for kind in KINDS}
+    deferred = {kind: 0.0 for kind in KINDS}
+    state = {"depth": 0, "first_flip": None, "frames": 0, "last_deferred": None}
+
+    def timed(kind, function):
+        def wrapper(*args, **kwargs):
+            if state["depth"]:
+                return function(*args, **kwargs)
+            state["depth"] += 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                state["depth"] -= 1
+                if state["first_flip"] is None:
+                    spent[kind] += end - start
+                elif kind != "first draw":
+                    deferred[kind] += end - start
+                    state["last_deferred"] = end
+        return wrapper
+
+    def wrap(owner, name, kind):
+        setattr(owner, name, timed(kind, getattr(owner, name)))
+
+    for module in ("display", "font", "mixer"):
+        wrap(getattr(pygame, module), "init", "module init")
+    wrap(pygame, "init", "module init")
+    wrap(pygame.display, "set_mode", "window")
+    wrap(pygame.image, "load", "asset decode")
+    wrap(pygame.mixer, "Sound", "asset decode")
+    wrap(main.Camera, "fit_background", "asset decode")
+    wrap(pygame.font, "Font", "construction")
+    for name in ("Simulation", "Hud", "Button", "Impacts", "EventBus", "EventLogger", "AudioPlayer", "HitEffects"):
+        wrap(main, name, "construction")
+    wrap(main, "draw_title_screen", "first draw")
+    wrap(main.GCPolicy, "loaded", "collection")
+
+    flip = pygame.display.flip
+    def first_flip():
+        flip()
+        if state["first_flip"] is None:
+            state["first_flip"] = time.perf_counter()
+    pygame.display.flip = first_flip
+
+    # The title screen is only flipped when it changes, so frames are counted by input polls
+    get = pygame.event.get
+    def counted_get(*args, **kwargs):
+        if state["first_flip"] is not None:
+            state["frames"] += 1
+            if state["frames"] > frames:
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return get(*args, **kwargs)
+    pygame.event.get = counted_get
+    main.IDLE_FPS = main.FPS  # Don't wait out idle frames
+
+    import asyncio
+    asyncio.run(main.main())
+
+    spent["import"] = imported - began
+    first = state["first_flip"] - began
+    spent["other"] = first - sum(spent.values())
+    last = state["last_deferred"]
+    print(json.dumps({"first_frame": first, "spent": spent, "deferred": deferred,
+                      "ready": (last - began) if last is not None else first}))
+
+def main():
+    parser = argparse.ArgumentParser(description="Time main.py's startup up to its first frame")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=30, help="frames to run after the first")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.frames)
+        return
+
+    runs = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", "--frames", str(args.frames)],
+                                capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    def median(values):
+        return statistics.median(values) * 1000
+
+    print(f"median of {len(runs)} runs, ms   {'before first frame':>18} {'deferred':>9}")
+    for kind in KINDS:
+        print(f"  {kind:<14} {median([run['spent'][kind] for run in runs]):>27.1f} "
+              f"{median([run['deferred'][kind] for run in runs]):>9.1f}")
+    print(f"first frame at {median([run['first_frame'] for run in runs]):.1f} ms, "
+          f"deferred work done by {median([run['ready'] for run in runs]):.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Stress test: fights with several bosses firing into the same bullet fields, timing how cost scales.
+
+Run from the repository root:
+    python tools/stress.py [--bosses 1 2 4 8] [--seconds S] [--seed N] [--phase2]
+
+For each boss count a headless Simulation is played by the scripted demo
+player, made invulnerable so the fight never ends. Every boss runs its own
+attack state machine; they share the bullet fields, the collision checks and
+the draw path. Bosses are kept above their phase 2 threshold (or, with
+--phase2, dropped to it after the intro and kept alive), so the load stays
+the same for the whole run. Every tick is stepped and then drawn as the
+render stage draws the bosses and bullets, each timed separately.
+
+Prints, per boss count, live boss bullets and tick and draw times, then a
+least-squares fit of tick plus draw time against live bullets over every
+tick sampled, and the bullet count at which that fit uses up the frame.
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game.settings import WIDTH, HEIGHT, FPS
+from game.camera import Camera
+from game.controls import Controls
+from game.replay import demo_controls
+from game.simulation import Simulation
+
+TICK = 1 / FPS
+PHASE2_HEALTH = 350  # Bosses switch to phase 2 at or below this
+
+def percentile(ordered, share):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+def run(bosses, seconds, seed, phase2, camera):
+    """Per-tick (live boss bullets, step seconds, draw seconds) of one stress fight"""
+    sim = Simulation(seed=seed, bosses=bosses)
+    sim.start()
+    sim.player.debug_invulnerable = True
+    floor = 1 if phase2 else PHASE2_HEALTH + 1
+    controls = Controls()
+    samples = []
+    for tick in range(int(seconds * FPS)):
+        demo_controls(sim, tick, controls)
+        began = time.perf_counter()
+        sim.step(TICK, controls)
+        stepped = time.perf_counter()
+        camera.surface.fill((0, 0, 0))
+        sim.draw_bosses(camera)
+        sim.draw_bullets(camera)
+        drawn = time.perf_counter()
+        sim.events.clear()
+        samples.append((len(sim.boss_bullets), stepped - began, drawn - stepped))
+        for boss in sim.bosses:
+            if phase2 and boss.state != "intro" and boss.health > PHASE2_HEALTH:
+                boss.health = PHASE2_HEALTH
+            boss.health = max(boss.health, floor)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Time ticks and draws with several bosses at once")
+    parser.add_argument("--bosses", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--seconds", type=float, default=30, help="length of each fight")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--phase2", action="store_true", help="fight the bosses in phase 2")
+    args = parser.parse_args()
+
+    pygame.init()
+    camera = Camera(pygame.Surface((WIDTH, HEIGHT)))
+    budget = TICK * 1000
+    print(f"{'bosses':>6} {'bullets':>8} {'peak':>6} {'tick ms':>8} {'p95':>6} {'draw ms':>8} {'p95':>6} "
+          f"{'frame p95':>9} {'us/bullet':>9}")
+    pooled = []
+    ceiling = None
+    for bosses in args.bosses:
+        samples = run(bosses, args.seconds, args.seed, args.phase2, camera)
+        pooled.extend(samples)
+        bullets = [count for count, _, _ in samples]
+        steps = sorted(step * 1000 for _, step, _ in samples)
+        draws = sorted(draw * 1000 for _, _, draw in samples)
+        frames = sorted((step + draw) * 1000 for _, step, draw in samples)
+        mean_bullets = statistics.fmean(bullets)
+        per_bullet = statistics.fmean(frames) * 1000 / mean_bullets if mean_bullets else 0
+        print(f"{bosses:>6} {mean_bullets:>8.0f} {max(bullets):>6} {statistics.fmean(steps):>8.2f} "
+              f"{percentile(steps, 0.95):>6.2f} {statistics.fmean(draws):>8.2f} {percentile(draws, 0.95):>6.2f} "
+              f"{percentile(frames, 0.95):>9.2f} {per_bullet:>9.2f}")
+        if percentile(frames, 0.95) <= budget and (ceiling is None or bosses > ceiling):
+            ceiling = bosses
+
+    counts = [count for count, _, _ in pooled]
+    if len(set(counts)) > 1:
+        slope, fixed = statistics.linear_regression(counts, [(step + draw) * 1000 for _, step, draw in pooled])
+        print(f"\ntick + draw ~ {fixed:.2f} ms + {slope * 1000:.2f} us per live bullet")
+        if slope > 0:
+            print(f"a {budget:.1f} ms frame fills at about {(budget - fixed) / slope:.0f} live bullets")
+    if ceiling is None:
+        print(f"no boss count kept its p95 tick + draw within {budget:.1f} ms")
+    else:
+        print(f"most bosses with p95 tick + draw within {budget:.1f} ms: {ceiling}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()